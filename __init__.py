@@ -0,0 +1,19 @@
+# /home/ubuntu/mtap_sdk/__init__.py
+import asyncio
+
+def install_uvloop() -> bool:
+    """Makes uvloop the asyncio event loop policy, if uvloop is installed.
+
+    Call this before starting the event loop (e.g. before `asyncio.run(...)`). uvloop's libuv-based
+    loop handles socket I/O with less per-event overhead than the default loop, which benefits the
+    request-heavy workloads MtapClient generates. Install it with `pip install mtap_sdk[uvloop]`.
+
+    Returns:
+        True if uvloop was installed as the event loop policy, False if uvloop is not available.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -1,35 +1,224 @@
 # /home/ubuntu/mtap_sdk/core/client.py
 import httpx
-import json
 import asyncio
+import functools
+import logging
+import re
 import time # For potential token expiry checks
-from typing import Any, Optional, AsyncGenerator, Dict, Union, List
+import types
+import weakref
+from typing import Any, Optional, AsyncGenerator, AsyncIterable, Awaitable, Callable, Dict, Mapping, Type, Union, List
 import urllib.parse
 import mimetypes # For guessing content type of files in multipart
 
+from . import serialization
 from .config import MtapClientConfig
 from .models import (
-    Memory, SearchResult, RevocationReceipt, AuditLogSlice,
+    Memory, SearchResult, RevocationReceipt, AuditLogSlice, AuditLogEntry,
     ConsentArtifact, ConsentArtifactStatus, PolicyDetails, PolicySummary, MemorySummary
 )
 from .errors import (
-    MtapSdkError, ConfigurationError, NotImplementedError, MtapApiError,
+    MtapSdkError, ConfigurationError, MtapApiError,
     AuthenticationError, AuthorizationError, NotFoundError, InvalidRequestError,
     RateLimitError, ServerError, IdempotencyConflictError, NetworkError, StreamingError
 )
 from mtap_sdk.transport.base import BaseTransport
-from mtap_sdk.transport.http import HttpTransport
+from mtap_sdk.transport.compression import check_encoding, compress_bytes, compress_stream
+from mtap_sdk.transport.multipart import MultipartEncoder
+from mtap_sdk.transport.http import HttpTransport, AiohttpTransport, AiohttpResponse, AIOHTTP_AVAILABLE
 from mtap_sdk.session.base import BaseAuthProvider, SessionContext
 from mtap_sdk.governance.base import BaseConsentManager, BasePolicyManager
 from mtap_sdk.extensions.base import ExtensionRegistry, BaseExtension
 
+try:
+    import ijson
+except ImportError: # ijson is optional (installed via the "speedups" extra)
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# Cached auth headers are dropped this many seconds before the token's `expires_at`.
+_AUTH_HEADERS_EXPIRY_MARGIN = 30.0
+
+# JSON bodies larger than this are parsed incrementally (when ijson is available) for endpoints
+# that opt in, instead of being buffered in full before parsing.
+_INCREMENTAL_JSON_THRESHOLD = 256 * 1024
+
+_JSON_DECODE_ERRORS = (*serialization.DECODE_ERRORS, ijson.JSONError) if ijson else serialization.DECODE_ERRORS
+
+class _ResponseReader:
+    """Exposes a streamed response as the async file-like object (`await read(n)`) ijson consumes."""
+
+    def __init__(self, response: Any):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0: # ijson probes the return type with a zero-length read
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+async def _load_json_incrementally(response: Any) -> Any:
+    """Parses a streamed JSON response chunk by chunk, so the raw body is never held in full."""
+    async for document in ijson.items(_ResponseReader(response), "", use_float=True):
+        return document
+    return {}
+
+async def _read_streamed_body(response: Any) -> bytearray:
+    """Reads a streamed response into one bytearray as chunks arrive.
+
+    The transport does not keep its own copy of a streamed body, so the body is held once and
+    each chunk can be released as soon as it has been appended. The decoders accept the
+    bytearray directly.
+    """
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body += chunk
+    return body
+
+# Exception raised for each non-5xx error status; 5xx maps to ServerError, anything else to MtapApiError.
+_STATUS_ERROR_MAP: Mapping[int, Type[MtapApiError]] = types.MappingProxyType({
+    400: InvalidRequestError,
+    401: AuthenticationError,
+    403: AuthorizationError,
+    404: NotFoundError,
+    409: IdempotencyConflictError,
+    429: RateLimitError,
+})
+
+def _extract_error_message(error_payload: Any) -> Optional[str]:
+    """Returns the error message from a decoded error body, or None if it doesn't carry one."""
+    if isinstance(error_payload, str):
+        return error_payload or None
+    if not isinstance(error_payload, dict):
+        return None
+    details = error_payload.get("detail", error_payload.get("error"))
+    if isinstance(details, str):
+        return details
+    if isinstance(details, dict):
+        return details.get("message", str(details))
+    return error_payload.get("message") or None
+
+# Endpoint path templates, pre-bound so each call is a single str.format() on a constant.
+_PATH_MEMORY = "memories/{}".format
+_PATH_MEMORY_REVISION = "memories/{}/revisions/{}".format
+_PATH_MEMORY_APPEND = "memories/{}/append".format
+_PATH_MEMORY_REVOKE = "memories/{}/revoke".format
+
+# Matches strings that quote_plus() would return unchanged.
+_is_url_safe = re.compile(r"[A-Za-z0-9_.~-]*").fullmatch
+
+def _quote_param(text: str) -> str:
+    return text if _is_url_safe(text) else urllib.parse.quote_plus(text)
+
+def _quote_path_segment(segment: str) -> str:
+    """Escapes an ID for use as a single path segment (so e.g. "/" cannot change the endpoint)."""
+    return segment if _is_url_safe(segment) else urllib.parse.quote(segment, safe="")
+
+@functools.lru_cache(maxsize=256, typed=True) # typed, so that True and 1 are cached separately
+def _encode_int_param(key: str, value: Union[int, bool]) -> str:
+    if value is True:
+        encoded_value = "true"
+    elif value is False:
+        encoded_value = "false"
+    else:
+        encoded_value = str(value)
+    return _quote_param(key) + "=" + encoded_value
+
+def _encode_param(key: str, value: Any) -> str:
+    # Only int/bool pairs (limits, offsets, flags) recur often enough to be worth caching; other
+    # values (which may be unhashable, e.g. lists) are quoted directly.
+    if type(value) in (int, bool) and type(key) is str:
+        return _encode_int_param(key, value)
+    return _quote_param(str(key)) + "=" + _quote_param(str(value))
+
+def _encode_params(params: Dict[str, Any]) -> str:
+    """Encodes scalar query parameters like urllib.parse.urlencode, with bools as "true"/"false".
+
+    Int/bool pairs that recur across requests (e.g. "limit=100") come from a small cache, and
+    values made of URL-safe characters only skip quoting.
+    """
+    return "&".join([_encode_param(key, value) for key, value in params.items()])
+
+def _mtap_headers(
+    request_id: Optional[str] = None,
+    consent_proof: Optional[str] = None,
+    policy_snapshot_id: Optional[str] = None
+) -> Dict[str, str]:
+    """Builds the optional MTAP request headers shared by the endpoint methods."""
+    headers: Dict[str, str] = {}
+    if request_id:
+        headers["Idempotency-Key"] = request_id
+    if consent_proof:
+        headers["X-Consent-Proof"] = consent_proof
+    if policy_snapshot_id:
+        headers["X-Policy-Snapshot"] = policy_snapshot_id
+    return headers
+
+@functools.lru_cache(maxsize=256)
+def _guess_content_type(filename: str) -> str:
+    return mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+def _encode_memory_upload(
+    data: Union[bytes, AsyncIterable[bytes]],
+    metadata: Dict[str, Any],
+    content_type: Optional[str],
+    filename: str,
+    context: Optional[Dict[str, Any]],
+    invalid_data_message: str,
+    compression: Optional[str] = None
+) -> MultipartEncoder:
+    """Builds the multipart body (metadata, optional context, data) for capture/append uploads.
+
+    With `compression`, the data part is compressed (incrementally, if it is streamed) and labelled
+    with a Content-Encoding part header.
+    """
+    if not isinstance(data, bytes) and not hasattr(data, "__aiter__"):
+        raise InvalidRequestError(invalid_data_message)
+
+    files: Dict[str, Any] = {
+        "metadata": (None, serialization.dumps(metadata), "application/json")
+    }
+    if context:
+        files["context"] = (None, serialization.dumps(context), "application/json")
+    data_content_type = content_type if content_type else _guess_content_type(filename)
+    if compression:
+        if isinstance(data, bytes):
+            data = compress_bytes(data, compression)
+        else:
+            data = compress_stream(data, compression)
+        files["data"] = (filename, data, data_content_type, {"Content-Encoding": compression})
+    else:
+        files["data"] = (filename, data, data_content_type)
+    return MultipartEncoder(files)
+
+def _set_body_headers(headers: Dict[str, str], body: MultipartEncoder) -> None:
+    headers["Content-Type"] = body.content_type
+    if body.content_length is not None:
+        headers["Content-Length"] = str(body.content_length)
+
 class MtapClient:
-    """Main client for interacting with the MTAP API."""
+    """Main client for interacting with the MTAP API.
+
+    The client is fully asynchronous. For high request volumes, call `mtap_sdk.install_uvloop()`
+    before starting the event loop to run on uvloop when it is installed.
+    """
+
+    # Transports shared by clients created with `share_transport=True`, and how many clients use each.
+    _shared_transports: "weakref.WeakValueDictionary[tuple, BaseTransport]" = weakref.WeakValueDictionary()
+    _shared_transport_refs: "weakref.WeakKeyDictionary[BaseTransport, int]" = weakref.WeakKeyDictionary()
 
     def __init__(self, config: MtapClientConfig):
         if not isinstance(config, MtapClientConfig):
             raise ConfigurationError("Invalid MtapClientConfig provided.")
         self.config = config
+        if self.config.compression is not None:
+            check_encoding(self.config.compression)
+        # Fixed for the lifetime of the client, so it is computed once rather than per request.
+        # (config.default_headers are installed on the transport's connection pool.)
+        self._base_url = self.config.server_url.rstrip("/")
         
         self.transport: BaseTransport = self._get_transport_provider()
 
@@ -42,17 +231,84 @@ class MtapClient:
         
         self.extension_registry = ExtensionRegistry()
         self._session_context: Optional[SessionContext] = None
+        self._cached_auth_headers: Optional[Dict[str, str]] = None
+        self._auth_headers_expire_at: float = 0.0 # time.monotonic() deadline for _cached_auth_headers
+        self._needs_preconnect = True
+        self._preconnect_task: Optional[asyncio.Future] = None
         self._is_closed = False
 
     def _get_transport_provider(self) -> BaseTransport:
-        if not isinstance(self.config.transport_preference, str):
+        if self.config.share_transport:
+            return self._acquire_shared_transport(self.config)
+        return self._create_transport(self.config)
+
+    @staticmethod
+    def _create_transport(config: MtapClientConfig) -> BaseTransport:
+        if not isinstance(config.transport_preference, str):
             raise ConfigurationError("Transport preference must be a string.")
             
-        transport_pref = self.config.transport_preference.lower()
+        transport_pref = config.transport_preference.lower()
+        if transport_pref in ["http", "https"] and config.http_backend == "aiohttp" and AIOHTTP_AVAILABLE:
+            return AiohttpTransport(
+                config.default_retry_config, config.default_timeout_config, config.connection_limits,
+                default_headers=config.default_headers
+            )
         if transport_pref in ["http", "https", "http3", "http/3"]:
-            return HttpTransport(self.config.default_retry_config, self.config.default_timeout_config)
+            # httpx has no HTTP/3 support; "http3" is served over the best protocol it can negotiate (HTTP/2).
+            return HttpTransport(
+                config.default_retry_config, config.default_timeout_config,
+                config.connection_limits, http2=config.http2, default_headers=config.default_headers
+            )
         else:
-            raise NotImplementedError(f"Transport 	"{self.config.transport_preference}	" not implemented.")
+            raise NotImplementedError(f"Transport '{config.transport_preference}' not implemented.")
+
+    @staticmethod
+    def _shared_transport_key(config: MtapClientConfig) -> tuple:
+        return (
+            config.server_url, config.transport_preference, config.http_backend, id(config.auth_provider.__class__),
+            frozenset((config.default_headers or {}).items()) # Installed on the transport, so part of its identity
+        )
+
+    @classmethod
+    def shared_transport_for(cls, config: MtapClientConfig) -> Optional[BaseTransport]:
+        """Returns the transport currently shared by clients created with `share_transport=True`
+        and a config matching `config` (same server, transport, auth provider type and default
+        headers), or None if no such client is open.
+
+        This is a lookup only (e.g. to inspect `HttpTransport.stats()`; AiohttpTransport has no
+        `stats()`): it does not take a reference, and the transport is closed when the last client
+        using it is closed.
+        """
+        return cls._shared_transports.get(cls._shared_transport_key(config))
+
+    @classmethod
+    def _acquire_shared_transport(cls, config: MtapClientConfig) -> BaseTransport:
+        """Returns the shared transport for `config`, creating it if needed, and takes a reference.
+
+        The transport (and its connection pool) is created by the first client and reused by later
+        ones, using the first client's retry, timeout and connection settings. Every acquire is paired
+        with `_release_shared_transport` in `close()`; the transport is closed when the last
+        reference is released. Shared transports must be used from a single event loop.
+        """
+        key = cls._shared_transport_key(config)
+        transport = cls._shared_transports.get(key)
+        if transport is None:
+            transport = cls._create_transport(config)
+            cls._shared_transports[key] = transport
+        cls._shared_transport_refs[transport] = cls._shared_transport_refs.get(transport, 0) + 1
+        return transport
+
+    @classmethod
+    async def _release_shared_transport(cls, config: MtapClientConfig, transport: BaseTransport) -> None:
+        remaining = cls._shared_transport_refs.get(transport, 1) - 1
+        if remaining > 0:
+            cls._shared_transport_refs[transport] = remaining
+            return
+        cls._shared_transport_refs.pop(transport, None)
+        key = cls._shared_transport_key(config)
+        if cls._shared_transports.get(key) is transport:
+            del cls._shared_transports[key]
+        await transport.close()
 
     async def is_authenticated(self) -> bool:
         """Checks if the client has an active and valid session context."""
@@ -71,6 +327,7 @@ class MtapClient:
     async def authenticate(self) -> SessionContext:
         if self._is_closed:
             raise MtapSdkError("Client is closed.")
+        self._invalidate_auth_headers()
         self._session_context = await self.auth_provider.authenticate()
         if not isinstance(self._session_context, SessionContext):
             # Invalidate potentially partially set context
@@ -101,44 +358,73 @@ class MtapClient:
     async def close(self) -> None:
         if self._is_closed:
             return
+        if self._preconnect_task is not None:
+            if not self._preconnect_task.done():
+                self._preconnect_task.cancel()
+                await asyncio.gather(self._preconnect_task, return_exceptions=True)
+            self._preconnect_task = None
         if self.transport:
-            await self.transport.close()
+            if self.config.share_transport:
+                await self._release_shared_transport(self.config, self.transport)
+            else:
+                await self.transport.close()
         if self.auth_provider:
             try:
                 await self.auth_provider.logout()
             except Exception as e:
-                print(f"Error during auth_provider logout: {e}") 
+                logger.warning("Error during auth_provider logout: %s", e, exc_info=True)
         self._session_context = None # Clear session context on close
+        self._invalidate_auth_headers()
         self._is_closed = True
 
+    def _invalidate_auth_headers(self) -> None:
+        self._cached_auth_headers = None
+        self._auth_headers_expire_at = 0.0
+
+    async def _auth_headers(self) -> Dict[str, str]:
+        """Returns the auth headers for a request, authenticating first if needed.
+
+        Headers are cached until shortly before the session token's `expires_at` (a Unix timestamp
+        in `token_info`), so steady-state requests skip the session check and the auth provider call.
+        Without a known expiry the provider is asked every time, as it may refresh tokens internally.
+        """
+        if self._cached_auth_headers is not None and time.monotonic() < self._auth_headers_expire_at:
+            return self._cached_auth_headers
+
+        # Ensure authenticated session before making a request that requires auth
+        # get_session_context will handle auto-authentication if needed and configured
+        # Only the first request checks whether to preconnect, whichever way the check goes.
+        first_request = self._needs_preconnect
+        self._needs_preconnect = False
+        if first_request and not await self.is_authenticated():
+            # First request: start opening the connection to the server while authentication is in
+            # progress, so the request itself doesn't also pay for the TCP/TLS handshake. It is not
+            # awaited: if authentication finishes first, the request goes ahead (and close() cancels
+            # a preconnect that is still running).
+            self._preconnect_task = asyncio.ensure_future(self.transport.preconnect(self._base_url + "/"))
+        session_context = await self.get_session_context(auto_authenticate=True)
+        if not session_context: # Should not happen if auto_authenticate is True and auth succeeds
+            raise AuthenticationError("Failed to establish authenticated session for request.")
+
+        auth_headers = await self.auth_provider.get_auth_headers()
+        expires_at = (session_context.token_info or {}).get("expires_at")
+        if isinstance(expires_at, (int, float)):
+            remaining = expires_at - time.time() - _AUTH_HEADERS_EXPIRY_MARGIN
+            self._cached_auth_headers = auth_headers
+            self._auth_headers_expire_at = time.monotonic() + remaining
+        else:
+            self._invalidate_auth_headers()
+        return auth_headers
+
     def _handle_api_error(self, status_code: int, error_payload: Any, url: str):
-        message = f"API Error at {url} (Status {status_code})"
-        details = None
-        if isinstance(error_payload, dict):
-            details = error_payload.get("detail", error_payload.get("error"))
-            if isinstance(details, str):
-                message = details
-            elif isinstance(details, dict):
-                 message = details.get("message", str(details))
-            elif error_payload.get("message"): 
-                message = error_payload["message"]
-        elif isinstance(error_payload, str) and error_payload:
-            message = error_payload
-
-        error_map = {
-            400: InvalidRequestError,
-            401: AuthenticationError,
-            403: AuthorizationError,
-            404: NotFoundError,
-            409: IdempotencyConflictError,
-            429: RateLimitError,
-        }
-        error_class = error_map.get(status_code)
-        if error_class:
-            raise error_class(message, status_code)
-        if 500 <= status_code < 600:
-            raise ServerError(message, status_code)
-        raise MtapApiError(message, status_code)
+        message = _extract_error_message(error_payload) or f"API Error at {url} (Status {status_code})"
+
+        if status_code == 401:
+            # The server rejected our credentials; don't keep sending the cached headers.
+            self._invalidate_auth_headers()
+
+        error_class = _STATUS_ERROR_MAP.get(status_code) or (ServerError if 500 <= status_code < 600 else MtapApiError)
+        raise error_class(message, status_code)
 
     async def _make_request(
         self,
@@ -150,42 +436,44 @@ class MtapClient:
         data: Optional[bytes] = None,
         json_data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None, 
-        stream_data: Optional[AsyncGenerator[bytes, None]] = None,
-        stream_response: bool = False
-    ) -> Union[Dict[str, Any], httpx.Response]:
+        stream_data: Optional[AsyncIterable[bytes]] = None,
+        stream_response: bool = False,
+        incremental_json: bool = False,
+        response_type: Optional[type] = None
+    ) -> Any:
+        """Sends a request and returns the decoded JSON body (or the raw response if `stream_response`).
+
+        If `response_type` (a model dataclass) is given, a JSON body is decoded straight into an
+        instance of it instead of a dict.
+
+        `incremental_json` is meant for endpoints that may return large pages (search, audit logs):
+        the response is streamed and, if it is JSON above `_INCREMENTAL_JSON_THRESHOLD` bytes and
+        ijson is installed, parsed while it is received rather than after buffering the whole body.
+        """
         if self._is_closed:
             raise MtapSdkError("Client is closed.")
         if not self.transport:
             raise ConfigurationError("Transport not initialized.")
 
-        # Ensure authenticated session before making a request that requires auth
-        # get_session_context will handle auto-authentication if needed and configured
-        session_context = await self.get_session_context(auto_authenticate=True)
-        if not session_context: # Should not happen if auto_authenticate is True and auth succeeds
-            raise AuthenticationError("Failed to establish authenticated session for request.")
-            
-        auth_headers = await self.auth_provider.get_auth_headers()
+        auth_headers = await self._auth_headers()
         
-        full_url = f"{self.config.server_url.rstrip("/")}/{path.lstrip("/")}"
+        full_url = self._base_url + "/" + path.lstrip("/")
         if params:
-            encoded_params = {k: str(v).lower() if isinstance(v, bool) else v for k, v in params.items()}
-            full_url += "?" + urllib.parse.urlencode(encoded_params)
+            full_url += "?" + _encode_params(params)
             
-        all_headers = {**(self.config.default_headers or {}), **(headers or {}), **auth_headers}
-        
-        if json_data and not files and "Content-Type" not in all_headers:
-             all_headers["Content-Type"] = "application/json; charset=utf-8"
+        # Transport-level default headers are merged in by the transport's client.
+        all_headers = {**headers, **auth_headers} if headers else auth_headers
 
         raw_response: Optional[httpx.Response] = None
         try:
             raw_response = await self.transport.request(
                 method=method, url=full_url, headers=all_headers,
-                data=data, json=json_data, files=files, stream_data=stream_data,
+                data=data, json_data=json_data, files=files, stream_data=stream_data,
                 timeout=self.config.default_timeout_config, 
-                stream_response=stream_response
+                stream_response=stream_response or incremental_json
             )
-        except NetworkError as e:
-            raise e 
+        except (NetworkError, InvalidRequestError):
+            raise
         except Exception as e:
             raise MtapSdkError(f"Unexpected error during request transport: {e}") from e
 
@@ -194,7 +482,7 @@ class MtapClient:
             try:
                 error_content_bytes = await raw_response.aread()
                 if "application/json" in raw_response.headers.get("content-type", "").lower():
-                    error_payload = json.loads(error_content_bytes.decode("utf-8"))
+                    error_payload = serialization.loads(error_content_bytes)
                 else:
                     error_payload = error_content_bytes.decode("utf-8", errors="replace")
             except Exception:
@@ -208,14 +496,28 @@ class MtapClient:
             return raw_response 
         else:
             try:
-                response_content_bytes = await raw_response.aread()
+                if (
+                    incremental_json and ijson is not None
+                    and "application/json" in raw_response.headers.get("content-type", "").lower()
+                    and int(raw_response.headers.get("content-length") or 0) > _INCREMENTAL_JSON_THRESHOLD
+                ):
+                    document = await _load_json_incrementally(raw_response)
+                    if response_type is not None:
+                        return serialization.convert(document, response_type)
+                    return document
+                if incremental_json:
+                    response_content_bytes = await _read_streamed_body(raw_response)
+                else:
+                    response_content_bytes = await raw_response.aread()
                 if not response_content_bytes:
                     return {} 
                 if "application/json" in raw_response.headers.get("content-type", "").lower():
-                    return json.loads(response_content_bytes.decode("utf-8"))
+                    if response_type is not None:
+                        return serialization.loads_as(response_content_bytes, response_type)
+                    return serialization.loads(response_content_bytes)
                 else:
-                    return {"raw_content": response_content_bytes, "content_type": raw_response.headers.get("content-type")}
-            except json.JSONDecodeError as e:
+                    return {"raw_content": bytes(response_content_bytes), "content_type": raw_response.headers.get("content-type")}
+            except _JSON_DECODE_ERRORS as e:
                 raise MtapApiError(f"Failed to decode JSON response from {full_url}: {e}", raw_response.status_code) from e
             except Exception as e:
                 raise MtapSdkError(f"Error processing successful response from {full_url}: {e}") from e
@@ -234,39 +536,24 @@ class MtapClient:
         request_id: Optional[str] = None 
     ) -> Memory:
         path = "memories"
-        headers = {}
-        if request_id:
-            headers["Idempotency-Key"] = request_id 
-        if consent_proof:
-            headers["X-Consent-Proof"] = consent_proof
-        current_policy_id = policy_snapshot_id or self.config.default_policy_snapshot_id
-        if current_policy_id:
-            headers["X-Policy-Snapshot"] = current_policy_id
-
-        files: Dict[str, Any] = {
-            "metadata": (None, json.dumps(metadata), "application/json")
-        }
-        if context:
-            files["context"] = (None, json.dumps(context), "application/json")
-
-        actual_filename = filename if filename else "untitled"
-        data_content_type = content_type if content_type else mimetypes.guess_type(actual_filename)[0] or "application/octet-stream"
-
-        if isinstance(data, bytes):
-            files["data"] = (actual_filename, data, data_content_type)
-        elif hasattr(data, "__aiter__"): 
-            files["data"] = (actual_filename, data, data_content_type)
-        else:
-            raise InvalidRequestError("Data must be bytes or an async generator.")
+        headers = _mtap_headers(
+            request_id=request_id, consent_proof=consent_proof,
+            policy_snapshot_id=policy_snapshot_id or self.config.default_policy_snapshot_id
+        )
+        body = _encode_memory_upload(
+            data, metadata, content_type, filename or "untitled", context,
+            "Data must be bytes or an async generator.", self.config.compression
+        )
+        _set_body_headers(headers, body)
 
-        response_json = await self._make_request(
+        memory = await self._make_request(
             "POST", path, expected_status=[201],
             headers=headers, 
-            files=files
+            stream_data=body, response_type=Memory
         )
-        if not isinstance(response_json, dict):
-            raise MtapApiError(f"Capture memory response was not a JSON object: {type(response_json)}")
-        return Memory(**response_json)
+        if not isinstance(memory, Memory):
+            raise MtapApiError(f"Capture memory response was not a JSON object: {type(memory)}")
+        return memory
 
     async def append_to_memory(
         self, 
@@ -278,33 +565,21 @@ class MtapClient:
         consent_proof: Optional[str] = None, 
         request_id: Optional[str] = None
     ) -> Memory:
-        path = f"memories/{parent_memory_id}/append"
-        headers = {}
-        if request_id:
-            headers["Idempotency-Key"] = request_id
-        if consent_proof:
-            headers["X-Consent-Proof"] = consent_proof
-
-        files: Dict[str, Any] = {
-            "metadata": (None, json.dumps(metadata), "application/json")
-        }
-        actual_filename = filename if filename else "untitled_append"
-        data_content_type = content_type if content_type else mimetypes.guess_type(actual_filename)[0] or "application/octet-stream"
-
-        if isinstance(data, bytes):
-            files["data"] = (actual_filename, data, data_content_type)
-        elif hasattr(data, "__aiter__"): 
-            files["data"] = (actual_filename, data, data_content_type)
-        else:
-            raise InvalidRequestError("Data must be bytes or an async generator for append.")
+        path = _PATH_MEMORY_APPEND(_quote_path_segment(parent_memory_id))
+        headers = _mtap_headers(request_id=request_id, consent_proof=consent_proof)
+        body = _encode_memory_upload(
+            data, metadata, content_type, filename or "untitled_append", None,
+            "Data must be bytes or an async generator for append.", self.config.compression
+        )
+        _set_body_headers(headers, body)
 
-        response_json = await self._make_request(
+        memory = await self._make_request(
             "POST", path, expected_status=[200, 201],
-            headers=headers, files=files
+            headers=headers, stream_data=body, response_type=Memory
         )
-        if not isinstance(response_json, dict):
-            raise MtapApiError(f"Append memory response was not a JSON object: {type(response_json)}")
-        return Memory(**response_json)
+        if not isinstance(memory, Memory):
+            raise MtapApiError(f"Append memory response was not a JSON object: {type(memory)}")
+        return memory
 
     async def get_memory(
         self, 
@@ -314,39 +589,45 @@ class MtapClient:
         byte_range: Optional[str] = None, 
         consent_proof: Optional[str] = None, 
         stream: bool = False
-    ) -> Union[Memory, httpx.Response]: 
-        path = f"memories/{memory_id}"
+    ) -> Union[Memory, httpx.Response, AiohttpResponse]:
+        """Fetches a memory, or with `stream=True` the open response for reading its body.
+
+        The streamed response must be closed by the caller (`await response.aclose()`). On the
+        httpx backend it is an `httpx.Response`; on the aiohttp backend it is an `AiohttpResponse`,
+        which only provides `status_code`, `headers`, `aread`, `aiter_bytes` and `aclose`.
+        """
         if revision_id:
-            path += f"/revisions/{revision_id}"
+            path = _PATH_MEMORY_REVISION(_quote_path_segment(memory_id), _quote_path_segment(revision_id))
+        else:
+            path = _PATH_MEMORY(_quote_path_segment(memory_id))
         
-        headers = {}
+        headers = _mtap_headers(consent_proof=consent_proof)
         if accept_format:
             headers["Accept"] = accept_format
         if byte_range:
             headers["Range"] = f"bytes={byte_range}" 
-        if consent_proof:
-            headers["X-Consent-Proof"] = consent_proof
 
         expected_statuses = [200]
         if byte_range: expected_statuses.append(206) 
 
         response_data = await self._make_request(
             "GET", path, expected_status=expected_statuses,
-            headers=headers, stream_response=stream
+            headers=headers, stream_response=stream, response_type=Memory
         )
 
         if stream:
             return response_data 
         else:
-            if "raw_content" in response_data and isinstance(response_data, dict):
+            if isinstance(response_data, Memory):
+                return response_data
+
+            if isinstance(response_data, dict) and "raw_content" in response_data:
                 mem_id = memory_id
                 mem_content_type = response_data.get("content_type", "application/octet-stream")
                 mem_metadata = {} 
                 return Memory(id=mem_id, content_type=mem_content_type, metadata=mem_metadata, _data_blob=response_data["raw_content"])
             
-            if not isinstance(response_data, dict):
-                 raise MtapApiError(f"Unexpected response type for non-streamed get_memory: {type(response_data)}")
-            return Memory(**response_data) 
+            raise MtapApiError(f"Unexpected response type for non-streamed get_memory: {type(response_data)}")
 
     async def search_memories(
         self, 
@@ -379,14 +660,15 @@ class MtapClient:
         if privacy_budget_request:
             json_body["privacy_budget"] = privacy_budget_request
 
-        headers = {}
-        if consent_proof:
-            headers["X-Consent-Proof"] = consent_proof
+        headers = _mtap_headers(consent_proof=consent_proof)
 
-        response_json = await self._make_request("POST", path, params=params, headers=headers, json_data=json_body if json_body else None, expected_status=[200]) 
-        if not isinstance(response_json, dict):
-            raise MtapApiError(f"Search response was not a JSON object: {type(response_json)}")
-        return SearchResult(**response_json)
+        search_result = await self._make_request(
+            "POST", path, params=params, headers=headers, json_data=json_body if json_body else None,
+            expected_status=[200], incremental_json=True, response_type=SearchResult
+        )
+        if not isinstance(search_result, SearchResult):
+            raise MtapApiError(f"Search response was not a JSON object: {type(search_result)}")
+        return search_result
 
     async def revoke_memory(
         self, 
@@ -396,21 +678,20 @@ class MtapClient:
         consent_proof: Optional[str] = None,
         request_id: Optional[str] = None
     ) -> RevocationReceipt:
-        path = f"memories/{memory_id}/revoke"
-        headers = {}
-        if consent_proof:
-            headers["X-Consent-Proof"] = consent_proof
-        if request_id:
-            headers["Idempotency-Key"] = request_id
+        path = _PATH_MEMORY_REVOKE(_quote_path_segment(memory_id))
+        headers = _mtap_headers(request_id=request_id, consent_proof=consent_proof)
         
         json_body: Dict[str, Any] = {"cascade": cascade}
         if reason_code:
             json_body["reason_code"] = reason_code
             
-        response_json = await self._make_request("POST", path, headers=headers, json_data=json_body, expected_status=[200, 202])
-        if not isinstance(response_json, dict):
-            raise MtapApiError(f"Revoke response was not a JSON object: {type(response_json)}")
-        return RevocationReceipt(**response_json)
+        receipt = await self._make_request(
+            "POST", path, headers=headers, json_data=json_body, expected_status=[200, 202],
+            response_type=RevocationReceipt
+        )
+        if not isinstance(receipt, RevocationReceipt):
+            raise MtapApiError(f"Revoke response was not a JSON object: {type(receipt)}")
+        return receipt
 
     async def audit_log(
         self, 
@@ -425,7 +706,7 @@ class MtapClient:
         path = "audit/logs"
         params: Dict[str, Any] = {"limit": limit}
         if scope:
-            params["scope"] = json.dumps(scope) 
+            params["scope"] = serialization.dumps(scope) 
         if action_types:
             params["action_types"] = ",".join(action_types) 
         if since:
@@ -435,14 +716,101 @@ class MtapClient:
         if page_token:
             params["page_token"] = page_token
 
-        headers = {}
-        if consent_proof:
-            headers["X-Consent-Proof"] = consent_proof
+        headers = _mtap_headers(consent_proof=consent_proof)
+
+        log_slice = await self._make_request(
+            "GET", path, params=params, headers=headers, expected_status=[200],
+            incremental_json=True, response_type=AuditLogSlice
+        )
+        if not isinstance(log_slice, AuditLogSlice):
+            raise MtapApiError(f"Audit log response was not a JSON object: {type(log_slice)}")
+        return log_slice
 
-        response_json = await self._make_request("GET", path, params=params, headers=headers, expected_status=[200])
-        if not isinstance(response_json, dict):
-            raise MtapApiError(f"Audit log response was not a JSON object: {type(response_json)}")
-        return AuditLogSlice(**response_json)
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[Optional[str]], Awaitable[Any]],
+        token_attr: str,
+        page_token: Optional[str],
+        prefetch: bool
+    ) -> AsyncGenerator[Any, None]:
+        """Yields successive pages, following the continuation token stored in `token_attr`.
+
+        With `prefetch`, the request for the next page is started before the current page is yielded,
+        so the server round-trip overlaps with the caller consuming the current page. Each token is
+        only known once the previous page has arrived, so at most one page is fetched ahead.
+        """
+        pending: Optional[Awaitable[Any]] = fetch_page(page_token)
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                next_token = getattr(page, token_attr)
+                if next_token:
+                    pending = fetch_page(next_token)
+                    if prefetch:
+                        pending = asyncio.ensure_future(pending)
+                yield page
+        finally:
+            if isinstance(pending, asyncio.Future):
+                pending.cancel()
+                if pending.done() and not pending.cancelled():
+                    pending.exception() # Mark a failed prefetch as retrieved; the caller stopped early
+            elif pending is not None:
+                pending.close()
+
+    async def iter_search(
+        self, 
+        query: Optional[Union[str, Dict[str, Any]]] = None, 
+        query_dsl_type: Optional[str] = "simple_text", 
+        page_token: Optional[str] = None, 
+        page_size: int = 20, 
+        sort: Optional[str] = None, 
+        filters: Optional[Dict[str, Any]] = None, 
+        consent_proof: Optional[str] = None, 
+        privacy_budget_request: Optional[Dict[str, Any]] = None,
+        prefetch: bool = True
+    ) -> AsyncGenerator[Union[Memory, MemorySummary, Dict[str, Any]], None]:
+        """Iterates over search results across all pages, fetching the next page ahead if `prefetch`."""
+        async def fetch_page(token: Optional[str]) -> SearchResult:
+            return await self.search_memories(
+                query=query, query_dsl_type=query_dsl_type, page_token=token, page_size=page_size,
+                sort=sort, filters=filters, consent_proof=consent_proof,
+                privacy_budget_request=privacy_budget_request
+            )
+
+        pages = self._iter_pages(fetch_page, "next_page_token", page_token, prefetch)
+        try:
+            async for page in pages:
+                for result in page.results:
+                    yield result
+        finally:
+            await pages.aclose() # Cancels any prefetched page if the caller stops early
+
+    async def iter_audit_log(
+        self, 
+        scope: Optional[Dict[str, Any]] = None, 
+        action_types: Optional[List[str]] = None, 
+        since: Optional[str] = None, 
+        until: Optional[str] = None, 
+        page_token: Optional[str] = None,
+        limit: int = 100, 
+        consent_proof: Optional[str] = None,
+        prefetch: bool = True
+    ) -> AsyncGenerator[AuditLogEntry, None]:
+        """Iterates over audit log entries across all pages, fetching the next page ahead if `prefetch`."""
+        async def fetch_page(token: Optional[str]) -> AuditLogSlice:
+            return await self.audit_log(
+                scope=scope, action_types=action_types, since=since, until=until,
+                page_token=token, limit=limit, consent_proof=consent_proof
+            )
+
+        log_slices = self._iter_pages(fetch_page, "next_log_token", page_token, prefetch)
+        try:
+            async for log_slice in log_slices:
+                for entry in log_slice.log_entries:
+                    yield entry
+        finally:
+            await log_slices.aclose() # Cancels any prefetched page if the caller stops early
 
     async def get_consent_artifact(self, artifact_id: str) -> Optional[ConsentArtifact]:
         if self.consent_manager:
@@ -458,6 +826,10 @@ class MtapClient:
     async def get_extension(self, extension_id: str, config: Optional[Dict[str, Any]] = None) -> Optional[BaseExtension]:
         if self._is_closed:
             raise MtapSdkError("Client is closed.")
+        # Already-initialized extensions are returned without a trip through the event loop.
+        extension = self.extension_registry.get_extension_sync(extension_id)
+        if extension is not None:
+            return extension
         return await self.extension_registry.get_extension(extension_id, client=self, config=config)
 
     def register_extension(self, extension_class: type[BaseExtension]) -> None:
@@ -24,15 +24,27 @@ class TimeoutConfig:
     read_timeout: float = 30.0    # Seconds to wait for server to send data
     write_timeout: float = 30.0   # Seconds to wait for chunks to be written (for streaming uploads)
 
+@dataclass
+class ConnectionLimits:
+    """Configuration for the transport's connection pool."""
+    max_connections: int = 1000 # Maximum number of concurrent connections
+    max_keepalive_connections: int = 100 # Maximum number of idle connections kept alive in the pool (httpx backend only)
+    keepalive_expiry: float = 30.0 # Seconds an idle connection is kept in the pool
+
 @dataclass
 class MtapClientConfig:
     """Configuration for the MtapClient."""
     server_url: str
     auth_provider: BaseAuthProvider # Changed from Any to BaseAuthProvider
     transport_preference: str = "http3" # Or "http", "https"
+    http_backend: str = "aiohttp" # Or "httpx". Used for "http"/"https"; falls back to httpx if aiohttp is not installed
     default_policy_snapshot_id: Optional[str] = None
     default_retry_config: RetryConfig = field(default_factory=RetryConfig)
     default_timeout_config: TimeoutConfig = field(default_factory=TimeoutConfig)
+    connection_limits: ConnectionLimits = field(default_factory=ConnectionLimits)
+    http2: bool = True # Negotiate HTTP/2 with httpx when the optional `h2` package is installed
+    compression: Optional[str] = None # "gzip" or "zstd": compress uploaded memory data (sent with a part Content-Encoding)
+    share_transport: bool = False # Reuse one transport (connection pool) across clients for the same server, see MtapClient.shared_transport_for
     default_headers: Optional[dict[str, str]] = None # e.g., {"User-Agent": "MTAPSDK/0.1.0"}
     # Add other global configurations
 
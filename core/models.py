@@ -2,7 +2,9 @@
 from dataclasses import dataclass, field
 from typing import Any, Optional, List, Dict, Union, AsyncGenerator
 
-@dataclass
+from .serialization import from_dict
+
+@dataclass(slots=True)
 class Memory:
     """Represents a memory object in MTAP."""
     id: str
@@ -40,7 +42,7 @@ class Memory:
         # Potentially fetch from _data_link
         return None
 
-@dataclass
+@dataclass(slots=True)
 class MemorySummary:
     """Represents a summary of a memory object, often used in search results."""
     id: str
@@ -48,14 +50,14 @@ class MemorySummary:
     metadata_preview: Dict[str, Any] # Or a subset of metadata
     revision_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Represents the result of a memory search operation."""
     results: List[Union[Memory, MemorySummary]]
     next_page_token: Optional[str] = None
     privacy_budget_consumed: Optional[Dict[str, Any]] = None # e.g., {"epsilon": 0.1}
 
-@dataclass
+@dataclass(slots=True)
 class RevocationReceipt:
     """Confirms the revocation of a memory or consent artifact."""
     revocation_id: str
@@ -64,7 +66,7 @@ class RevocationReceipt:
     target_id: str # ID of the memory or consent artifact revoked
     reason_code: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class AuditLogEntry:
     """Represents a single entry in an audit log."""
     log_id: str
@@ -72,29 +74,36 @@ class AuditLogEntry:
     actor_id: str
     action: str # e.g., "CAPTURE", "GET", "REVOKE_CONSENT"
     target_resource: Dict[str, str] # e.g., {"memory_id": "..."} or {"consent_id": "..."}
-    details: Optional[Dict[str, Any]] = None
     status: str # e.g., "success", "failure"
+    details: Optional[Dict[str, Any]] = None
     consent_proof_used: Optional[str] = None # Reference to consent proof
 
-@dataclass
+@dataclass(slots=True)
 class AuditLogSlice:
     """Represents a slice of an audit log."""
     log_entries: List[AuditLogEntry]
     next_log_token: Optional[str] = None
 
-@dataclass
+    def __post_init__(self):
+        # Entries are already AuditLogEntry instances when decoded with msgspec, but plain
+        # dicts when the slice is built from a parsed JSON object.
+        self.log_entries = [
+            from_dict(entry, AuditLogEntry) if isinstance(entry, dict) else entry for entry in self.log_entries
+        ]
+
+@dataclass(slots=True)
 class ConsentArtifact:
     """Represents a consent artifact."""
     id: str
     granter_id: str # User granting consent
     grantee_id: str # Entity receiving consent
     scope: Dict[str, Any] # e.g., {"memories": ["id1", "id2"], "actions": ["GET"]}
-    conditions: Optional[Dict[str, Any]] = None # e.g., {"expiry_date": "..."}
     status: str # e.g., "active", "revoked", "expired"
+    conditions: Optional[Dict[str, Any]] = None # e.g., {"expiry_date": "..."}
     policy_snapshot_id: Optional[str] = None
     raw_artifact: Optional[str] = None # The signed artifact itself, if available
 
-@dataclass
+@dataclass(slots=True)
 class ConsentArtifactStatus:
     """Status of a consent artifact management operation."""
     artifact_id: str
@@ -102,7 +111,7 @@ class ConsentArtifactStatus:
     details: Optional[str] = None
     artifact: Optional[ConsentArtifact] = None
 
-@dataclass
+@dataclass(slots=True)
 class PolicySummary:
     """Summary of a data usage policy."""
     id: str
@@ -110,7 +119,7 @@ class PolicySummary:
     version: str
     description_short: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class PolicyDetails(PolicySummary):
     """Detailed information about a data usage policy."""
     description_full: Optional[str] = None
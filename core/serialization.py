@@ -0,0 +1,120 @@
+# /home/ubuntu/mtap_sdk/core/serialization.py
+import dataclasses
+import functools
+import json
+from typing import Any, Dict, Optional, Type, TypeVar, Union
+
+try:
+    import orjson
+except ImportError: # orjson is optional (installed via the "speedups" extra); fall back to the stdlib
+    orjson = None
+
+try:
+    import msgspec
+except ImportError: # msgspec is optional (installed via the "speedups" extra)
+    msgspec = None
+
+T = TypeVar("T")
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only need to catch this one.
+JSONDecodeError = json.JSONDecodeError
+
+class ModelValidationError(ValueError):
+    """A JSON value could not be turned into the requested model (not an object, or missing fields)."""
+
+# Everything `loads`/`loads_as`/`convert` raise for malformed or mismatched JSON.
+DECODE_ERRORS = (
+    (JSONDecodeError, ModelValidationError, msgspec.DecodeError) if msgspec
+    else (JSONDecodeError, ModelValidationError)
+)
+
+# Per-model msgspec decoders; None marks models msgspec cannot decode (e.g. unions of dataclasses).
+_model_decoders: Dict[type, Optional["msgspec.json.Decoder"]] = {}
+
+def _dumps_stdlib(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serializes `obj` to UTF-8 encoded JSON bytes.
+
+    Non-str dict keys are stringified as the stdlib does. Anything orjson rejects (e.g. integers
+    wider than 64 bits) is retried with the stdlib, so output doesn't depend on orjson being installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError: # orjson.JSONEncodeError subclasses TypeError
+            pass
+    return _dumps_stdlib(obj).encode("utf-8")
+
+def dumps(obj: Any) -> str:
+    """Serializes `obj` to a JSON string (see `dumps_bytes`)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return _dumps_stdlib(obj)
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Deserializes JSON from bytes-like or str input, without decoding bytes to str first."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+def _get_model_decoder(model: type) -> Optional["msgspec.json.Decoder"]:
+    try:
+        return _model_decoders[model]
+    except KeyError:
+        pass
+    try:
+        decoder = msgspec.json.Decoder(model)
+    except TypeError:
+        decoder = None
+    _model_decoders[model] = decoder
+    return decoder
+
+@functools.lru_cache(maxsize=None)
+def _field_names(model: type) -> frozenset:
+    return frozenset(f.name for f in dataclasses.fields(model))
+
+def from_dict(payload: Any, model: Type[T]) -> T:
+    """Builds the dataclass `model` from a parsed JSON object.
+
+    Keys the model does not declare are dropped and field types are not checked, so a server that
+    adds fields or loosens a type does not break decoding. Raises ModelValidationError if `payload`
+    is not an object or lacks a required field.
+    """
+    if not isinstance(payload, dict):
+        raise ModelValidationError(f"Expected a JSON object for {model.__name__}, got {type(payload).__name__}")
+    names = _field_names(model)
+    try:
+        return model(**{key: value for key, value in payload.items() if key in names})
+    except TypeError as e: # Missing required fields
+        raise ModelValidationError(f"Invalid {model.__name__}: {e}") from e
+
+def loads_as(data: Union[bytes, bytearray, memoryview], model: Type[T]) -> T:
+    """Deserializes a JSON object straight into the dataclass `model`.
+
+    With msgspec installed this is usually a single schema-directed pass from bytes to the model
+    instance. Bodies msgspec rejects on type grounds, and all bodies without msgspec, go through
+    `from_dict`, so the result does not depend on which extras are installed.
+    """
+    decoder = _get_model_decoder(model) if msgspec is not None else None
+    if decoder is not None:
+        try:
+            return decoder.decode(data)
+        except msgspec.ValidationError:
+            pass # Well-formed JSON that msgspec's stricter typing rejects; use the lenient path below
+    return from_dict(loads(data), model)
+
+def convert(payload: Any, model: Type[T]) -> T:
+    """Like `loads_as`, for an already parsed JSON value (e.g. from an incremental parser)."""
+    if msgspec is not None and _get_model_decoder(model) is not None:
+        try:
+            return msgspec.convert(payload, model)
+        except msgspec.ValidationError:
+            pass
+    return from_dict(payload, model)
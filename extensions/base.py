@@ -1,6 +1,10 @@
 # /home/ubuntu/mtap_sdk/extensions/base.py
+import asyncio
+import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Optional, Sequence, Tuple, Type
+
+logger = logging.getLogger(__name__)
 
 class BaseExtension(ABC):
     """Abstract base class for all MTAP SDK extensions."""
@@ -34,32 +38,59 @@ class ExtensionRegistry:
     """Manages the registration and retrieval of MTAP extensions."""
 
     def __init__(self):
+        # Both maps are copy-on-write: lookups read whatever dict is currently bound, and the rare
+        # writes publish a new dict by rebinding the attribute instead of mutating the shared one.
         self._extensions: Dict[str, Type[BaseExtension]] = {}
         self._initialized_extensions: Dict[str, BaseExtension] = {}
+        self._registered_ids: Tuple[str, ...] = () # Returned as-is by list_registered_extensions
+        # One lock per extension currently being initialized, so concurrent first calls initialize it once.
+        self._init_locks: Dict[str, asyncio.Lock] = {}
 
     def register(self, extension_class: Type[BaseExtension]) -> None:
         """Registers an extension class.
 
+        Registering the same class again is a no-op.
+
         Args:
             extension_class: The class of the extension to register.
         
         Raises:
-            ValueError: If the extension_id is not set or already registered.
+            ValueError: If the extension_id is not set or already registered to a different class.
         """
         if not hasattr(extension_class, 'extension_id') or not extension_class.extension_id:
             raise ValueError("Extension class must have a valid 'extension_id' attribute.")
         
-        if extension_class.extension_id in self._extensions:
-            raise ValueError(f"Extension with ID 	'{extension_class.extension_id}	' is already registered.")
+        extension_id = extension_class.extension_id
+        extensions = dict(self._extensions) # Copy-on-write, see __init__
+        if extensions.setdefault(extension_id, extension_class) is not extension_class:
+            raise ValueError(f"Extension with ID '{extension_id}' is already registered.")
+        if len(extensions) == len(self._extensions):
+            return # This class was already registered
         
-        self._extensions[extension_class.extension_id] = extension_class
-        print(f"Extension 	'{extension_class.extension_id}	' registered.")
+        self._extensions = extensions
+        self._registered_ids = (*self._registered_ids, extension_id)
+        logger.info("Extension '%s' registered.", extension_id)
+
+    def get_extension_sync(self, extension_id: str) -> Optional[BaseExtension]:
+        """Returns the extension if it is already initialized, without awaiting anything.
+
+        Callers on hot paths should try this first and fall back to `get_extension` only
+        when it returns None (not yet initialized, or not registered).
+
+        Args:
+            extension_id: The unique ID of the extension.
+
+        Returns:
+            The initialized instance of the extension, or None.
+        """
+        return self._initialized_extensions.get(extension_id)
 
     async def get_extension(self, extension_id: str, client: Any, config: Optional[Dict[str, Any]] = None) -> Optional[BaseExtension]:
         """Retrieves and initializes an extension by its ID.
 
         If the extension is retrieved for the first time, it will be instantiated and initialized.
-        Subsequent calls will return the already initialized instance.
+        Subsequent calls will return the already initialized instance. Concurrent first calls for
+        the same ID wait for a single initialization instead of each running their own.
 
         Args:
             extension_id: The unique ID of the extension.
@@ -69,25 +100,41 @@ class ExtensionRegistry:
         Returns:
             An initialized instance of the extension, or None if not registered.
         """
-        if extension_id in self._initialized_extensions:
+        try:
             return self._initialized_extensions[extension_id]
+        except KeyError:
+            pass
         
         extension_class = self._extensions.get(extension_id)
         if not extension_class:
-            print(f"Warning: Extension 	'{extension_id}	' not found in registry.")
+            logger.warning("Extension '%s' not found in registry.", extension_id)
             return None
         
-        try:
-            extension_instance = extension_class(client=client)
-            await extension_instance.initialize(config=config)
-            self._initialized_extensions[extension_id] = extension_instance
-            print(f"Extension 	'{extension_id}	' initialized and retrieved.")
-            return extension_instance
-        except Exception as e:
-            print(f"Error initializing extension 	'{extension_id}	': {e}")
-            return None
-
-    def list_registered_extensions(self) -> List[str]:
-        """Returns a list of IDs of all registered extensions."""
-        return list(self._extensions.keys())
+        init_lock = self._init_locks.setdefault(extension_id, asyncio.Lock())
+        async with init_lock:
+            # Another caller may have finished initializing it while we waited for the lock.
+            try:
+                return self._initialized_extensions[extension_id]
+            except KeyError:
+                pass
+            try:
+                extension_instance = extension_class(client=client)
+                await extension_instance.initialize(config=config)
+                self._initialized_extensions = {**self._initialized_extensions, extension_id: extension_instance}
+                logger.info("Extension '%s' initialized and retrieved.", extension_id)
+                return extension_instance
+            except Exception as e:
+                logger.warning("Error initializing extension '%s': %s", extension_id, e, exc_info=True)
+                return None
+            finally:
+                # Later callers take the lock-free path (or, after a failure, start over with a new lock).
+                if self._init_locks.get(extension_id) is init_lock:
+                    del self._init_locks[extension_id]
+
+    def list_registered_extensions(self) -> Sequence[str]:
+        """Returns the IDs of all registered extensions, in registration order.
+
+        The result is an immutable tuple shared between calls; use `list(...)` for a mutable copy.
+        """
+        return self._registered_ids
 
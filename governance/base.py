@@ -1,14 +1,103 @@
 # /home/ubuntu/mtap_sdk/governance/base.py
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Dict, List
+from collections import OrderedDict
+from typing import Any, Optional, Dict, List, Tuple
 
 from mtap_sdk.core.models import (
     ConsentArtifact, ConsentArtifactStatus, RevocationReceipt, 
     PolicyDetails, PolicySummary
 )
 
-class BaseConsentManager(ABC):
-    """Abstract base class for managing consent artifacts and proofs."""
+_MISSING = object()
+
+class _TTLCache:
+    """A small LRU cache whose entries expire after a per-entry TTL (time.monotonic based).
+
+    `invalidate()` bumps a generation counter (per key, or a global one for a full clear);
+    `set()` given the `generation()` token taken before a fetch started ignores the value if
+    the key was invalidated in the meantime, so an in-flight fetch can't write back stale data.
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._epoch = 0
+        self._key_generations: Dict[str, int] = {}
+
+    def get(self, key: str) -> Any:
+        """Returns the cached value, or `_MISSING` if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def generation(self, key: str) -> Tuple[int, int]:
+        """Returns a token to pass to `set()` for a value fetched from now on."""
+        return self._epoch, self._key_generations.get(key, 0)
+
+    def set(self, key: str, value: Any, ttl: float, generation: Optional[Tuple[int, int]] = None) -> None:
+        if ttl <= 0:
+            return
+        if generation is not None and generation != self.generation(key):
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drops one entry, or every entry if `key` is None."""
+        if key is None:
+            self._entries.clear()
+            self._epoch += 1
+            self._key_generations.clear()
+            return
+        self._entries.pop(key, None)
+        self._key_generations[key] = self._key_generations.get(key, 0) + 1
+        if len(self._key_generations) > self._maxsize:
+            # Forgetting per-key counters could let an old token match again; bumping the epoch
+            # makes every outstanding token stale instead.
+            self._epoch += 1
+            self._key_generations.clear()
+
+class _CachedLookupMixin:
+    """TTL/LRU caching shared by the managers' `get_*` methods.
+
+    Found results are kept for `cache_ttl_seconds`; lookups that returned None are kept for the
+    shorter `negative_cache_ttl_seconds`, so repeated misses don't each go to the server.
+    Set a TTL to 0 to disable that kind of caching.
+    """
+
+    cache_ttl_seconds: float = 300.0
+    negative_cache_ttl_seconds: float = 10.0
+    cache_maxsize: int = 512
+
+    def _lookup_cache(self) -> _TTLCache:
+        # Created lazily (subclasses are not required to call a base __init__) under a name that a
+        # subclass's own attributes are unlikely to shadow; the isinstance check guards against it anyway.
+        cache = getattr(self, "_mtap_lookup_cache", None)
+        if not isinstance(cache, _TTLCache):
+            cache = self._mtap_lookup_cache = _TTLCache(self.cache_maxsize)
+        return cache
+
+    def _cache_result(self, key: str, value: Any, generation: Optional[Tuple[int, int]] = None) -> None:
+        ttl = self.cache_ttl_seconds if value is not None else self.negative_cache_ttl_seconds
+        self._lookup_cache().set(key, value, ttl, generation)
+
+class BaseConsentManager(_CachedLookupMixin, ABC):
+    """Abstract base class for managing consent artifacts and proofs.
+
+    Subclasses implement `_create_consent_artifact`, `_fetch_consent_artifact` and
+    `_revoke_consent_artifact`; the public `get_consent_artifact` serves repeated lookups from a
+    TTL cache, and `create_consent_artifact` / `revoke_consent_artifact` drop the affected artifact
+    from it.
+    """
 
     @abstractmethod
     async def generate_consent_proof(
@@ -21,43 +110,108 @@ class BaseConsentManager(ABC):
         pass
 
     @abstractmethod
-    async def create_consent_artifact(
+    async def _create_consent_artifact(
         self, 
         artifact_data: Dict[str, Any]
     ) -> ConsentArtifactStatus:
-        """Creates a new consent artifact."""
+        """Creates a new consent artifact on the server."""
         pass
 
+    async def create_consent_artifact(
+        self, 
+        artifact_data: Dict[str, Any]
+    ) -> ConsentArtifactStatus:
+        """Creates a new consent artifact and drops any cached (e.g. negative) entry for its ID."""
+        status = None
+        try:
+            status = await self._create_consent_artifact(artifact_data)
+            return status
+        finally:
+            requested_id = artifact_data.get("id")
+            if requested_id is not None:
+                self.invalidate_consent_artifact(requested_id)
+            if status is not None and status.artifact_id:
+                self.invalidate_consent_artifact(status.artifact_id)
+
     @abstractmethod
-    async def get_consent_artifact(
+    async def _fetch_consent_artifact(
         self, 
         artifact_id: str
     ) -> Optional[ConsentArtifact]:
-        """Retrieves a specific consent artifact by its ID."""
+        """Retrieves a specific consent artifact by its ID from the server (uncached)."""
         pass
 
+    async def get_consent_artifact(
+        self, 
+        artifact_id: str
+    ) -> Optional[ConsentArtifact]:
+        """Retrieves a specific consent artifact by its ID, from the cache when possible."""
+        cache = self._lookup_cache()
+        artifact = cache.get(artifact_id)
+        if artifact is _MISSING:
+            generation = cache.generation(artifact_id)
+            artifact = await self._fetch_consent_artifact(artifact_id)
+            self._cache_result(artifact_id, artifact, generation)
+        return artifact
+
     @abstractmethod
-    async def revoke_consent_artifact(
+    async def _revoke_consent_artifact(
         self, 
         artifact_id: str, 
         reason_code: Optional[str] = None
     ) -> RevocationReceipt:
-        """Revokes a specific consent artifact."""
+        """Revokes a specific consent artifact on the server."""
         pass
 
+    async def revoke_consent_artifact(
+        self, 
+        artifact_id: str, 
+        reason_code: Optional[str] = None
+    ) -> RevocationReceipt:
+        """Revokes a specific consent artifact and drops it from the cache."""
+        try:
+            return await self._revoke_consent_artifact(artifact_id, reason_code=reason_code)
+        finally:
+            self.invalidate_consent_artifact(artifact_id)
+
+    def invalidate_consent_artifact(self, artifact_id: Optional[str] = None) -> None:
+        """Drops a cached consent artifact (or all of them, if `artifact_id` is None)."""
+        self._lookup_cache().invalidate(artifact_id)
+
     # Potentially add methods for listing consent artifacts, checking revocation status, etc.
 
-class BasePolicyManager(ABC):
-    """Abstract base class for managing data usage policies."""
+class BasePolicyManager(_CachedLookupMixin, ABC):
+    """Abstract base class for managing data usage policies.
+
+    Subclasses implement `_fetch_policy_details`; the public `get_policy_details` serves repeated
+    lookups (policy snapshot IDs rarely change within a session) from a TTL cache.
+    """
 
     @abstractmethod
-    async def get_policy_details(
+    async def _fetch_policy_details(
         self, 
         policy_id: str
     ) -> Optional[PolicyDetails]:
-        """Retrieves detailed information about a specific policy."""
+        """Retrieves detailed information about a specific policy from the server (uncached)."""
         pass
 
+    async def get_policy_details(
+        self, 
+        policy_id: str
+    ) -> Optional[PolicyDetails]:
+        """Retrieves detailed information about a specific policy, from the cache when possible."""
+        cache = self._lookup_cache()
+        details = cache.get(policy_id)
+        if details is _MISSING:
+            generation = cache.generation(policy_id)
+            details = await self._fetch_policy_details(policy_id)
+            self._cache_result(policy_id, details, generation)
+        return details
+
+    def invalidate_policy_details(self, policy_id: Optional[str] = None) -> None:
+        """Drops cached policy details (or all of them, if `policy_id` is None)."""
+        self._lookup_cache().invalidate(policy_id)
+
     @abstractmethod
     async def list_available_policies(
         self
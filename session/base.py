@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Optional, Dict
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class SessionContext:
     """Stores session-specific information."""
     user_id: Optional[str] = None
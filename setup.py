@@ -23,19 +23,31 @@ setup(
         "Topic :: Software Development :: Libraries :: Application Frameworks",
         "License :: OSI Approved :: MIT License", # Placeholder, confirm license
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10", # dataclass(slots=True)
     install_requires=[
-        "httpx>=0.27.0,<0.29.0", # Specify a version range for httpx
+        "httpx[http2]>=0.27.0,<0.29.0", # Specify a version range for httpx; the http2 extra pulls in h2 for HTTP/2 multiplexing
         # Add other dependencies here if any were introduced
         # e.g., "pyjwt" for token handling if not done by auth_provider itself
     ],
     extras_require={
+        "aiohttp": [
+            "aiohttp>=3.9.0", # Preferred backend for "http"/"https" transports
+        ],
+        "speedups": [
+            "orjson>=3.9.0", # Faster JSON encoding/decoding; the stdlib json module is used otherwise
+            "ijson>=3.1", # Incremental parsing of large search/audit log pages
+            "msgspec>=0.18", # Decodes response bodies directly into model dataclasses
+        ],
+        "uvloop": [
+            "uvloop>=0.17.0; sys_platform != 'win32'", # Faster event loop, see mtap_sdk.install_uvloop()
+        ],
+        "zstd": [
+            "zstandard>=0.22.0", # For MtapClientConfig(compression="zstd")
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.20.0",
@@ -0,0 +1,22 @@
+# /home/ubuntu/mtap_sdk/tests/test_client.py
+import urllib.parse
+
+import pytest
+
+from mtap_sdk.core.client import _encode_params
+
+@pytest.mark.parametrize("params", [
+    {"limit": 100, "offset": 0},
+    {"q": "hello world & more", "tag": "a/b?c=d", "name": "välue"},
+    {"safe": "A-z_0.9~", "empty": "", "ratio": 0.5, "none": None},
+    {"ids": ["m1", "m 2"], "negative": -3},
+    {1: "int key", "space key": "x"},
+])
+def test_encode_params_matches_urlencode(params):
+    assert _encode_params(params) == urllib.parse.urlencode(params)
+    assert _encode_params(params) == urllib.parse.urlencode(params) # second call may hit the cache
+
+def test_encode_params_writes_bools_in_lowercase_and_does_not_confuse_them_with_ints():
+    assert _encode_params({"active": True, "deleted": False}) == "active=true&deleted=false"
+    assert _encode_params({"active": 1, "deleted": 0}) == "active=1&deleted=0"
+    assert _encode_params({"active": True}) == "active=true"
@@ -0,0 +1,53 @@
+# /home/ubuntu/mtap_sdk/tests/test_extensions.py
+import asyncio
+
+import pytest
+
+from mtap_sdk.extensions.base import BaseExtension, ExtensionRegistry
+
+class _CountingExtension(BaseExtension):
+    extension_id = "ext.test.counting"
+    initialize_calls = 0
+
+    async def initialize(self, config=None):
+        type(self).initialize_calls += 1
+        await asyncio.sleep(0.01) # let the other callers pile up on the lock
+
+class _FailingExtension(BaseExtension):
+    extension_id = "ext.test.failing"
+
+    async def initialize(self, config=None):
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_initialize_once():
+    _CountingExtension.initialize_calls = 0
+    registry = ExtensionRegistry()
+    registry.register(_CountingExtension)
+    client = object()
+
+    instances = await asyncio.gather(*[
+        registry.get_extension(_CountingExtension.extension_id, client) for _ in range(10)
+    ])
+
+    assert _CountingExtension.initialize_calls == 1
+    assert all(instance is instances[0] for instance in instances)
+    assert instances[0].client is client
+    assert registry.get_extension_sync(_CountingExtension.extension_id) is instances[0]
+    assert registry._init_locks == {}
+
+@pytest.mark.asyncio
+async def test_failed_initialization_returns_none_and_releases_the_lock():
+    registry = ExtensionRegistry()
+    registry.register(_FailingExtension)
+
+    assert await registry.get_extension(_FailingExtension.extension_id, object()) is None
+    assert registry.get_extension_sync(_FailingExtension.extension_id) is None
+    assert registry._init_locks == {}
+
+@pytest.mark.asyncio
+async def test_unregistered_extension_returns_none():
+    registry = ExtensionRegistry()
+    assert await registry.get_extension("ext.test.missing", object()) is None
+    assert registry._init_locks == {}
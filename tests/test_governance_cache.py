@@ -0,0 +1,122 @@
+# /home/ubuntu/mtap_sdk/tests/test_governance_cache.py
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from mtap_sdk.governance.base import BaseConsentManager, BasePolicyManager
+
+class _ConsentManager(BaseConsentManager):
+    def __init__(self):
+        self.store = {}
+        self.fetches = 0
+        self.fetch_gate = None
+
+    async def generate_consent_proof(self, consent_artifact_id, operation_details):
+        return "proof"
+
+    async def _create_consent_artifact(self, artifact_data):
+        self.store[artifact_data["id"]] = dict(artifact_data)
+        return SimpleNamespace(artifact_id=artifact_data["id"])
+
+    async def _fetch_consent_artifact(self, artifact_id):
+        self.fetches += 1
+        artifact = self.store.get(artifact_id)
+        if self.fetch_gate is not None:
+            await self.fetch_gate.wait()
+        return artifact
+
+    async def _revoke_consent_artifact(self, artifact_id, reason_code=None):
+        self.store.pop(artifact_id, None)
+        return SimpleNamespace(artifact_id=artifact_id)
+
+class _PolicyManager(BasePolicyManager):
+    cache_maxsize = 2
+
+    def __init__(self):
+        self.fetched = []
+
+    async def _fetch_policy_details(self, policy_id):
+        self.fetched.append(policy_id)
+        return {"id": policy_id}
+
+    async def list_available_policies(self):
+        return []
+
+@pytest.mark.asyncio
+async def test_fetch_in_flight_during_revoke_is_not_cached():
+    manager = _ConsentManager()
+    manager.store["a1"] = {"id": "a1"}
+    manager.fetch_gate = asyncio.Event()
+
+    lookup = asyncio.ensure_future(manager.get_consent_artifact("a1"))
+    await asyncio.sleep(0) # fetch has read the (about to be stale) artifact and is waiting
+    await manager.revoke_consent_artifact("a1")
+    manager.fetch_gate.set()
+    assert await lookup == {"id": "a1"}
+
+    manager.fetch_gate = None
+    assert await manager.get_consent_artifact("a1") is None
+    assert manager.fetches == 2
+
+@pytest.mark.asyncio
+async def test_fetch_in_flight_during_full_invalidation_is_not_cached():
+    manager = _ConsentManager()
+    manager.store["a1"] = {"id": "a1"}
+    manager.fetch_gate = asyncio.Event()
+
+    lookup = asyncio.ensure_future(manager.get_consent_artifact("a1"))
+    await asyncio.sleep(0)
+    manager.invalidate_consent_artifact()
+    manager.fetch_gate.set()
+    await lookup
+
+    manager.fetch_gate = None
+    await manager.get_consent_artifact("a1")
+    assert manager.fetches == 2
+
+@pytest.mark.asyncio
+async def test_create_drops_cached_miss_and_revoke_drops_cached_hit():
+    manager = _ConsentManager()
+    assert await manager.get_consent_artifact("a1") is None
+    assert await manager.get_consent_artifact("a1") is None
+    assert manager.fetches == 1 # the miss was cached
+
+    await manager.create_consent_artifact({"id": "a1"})
+    assert await manager.get_consent_artifact("a1") == {"id": "a1"}
+    assert await manager.get_consent_artifact("a1") == {"id": "a1"}
+    assert manager.fetches == 2
+
+    await manager.revoke_consent_artifact("a1")
+    assert await manager.get_consent_artifact("a1") is None
+    assert manager.fetches == 3
+
+@pytest.mark.asyncio
+async def test_negative_entries_expire_after_their_own_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    manager = _ConsentManager()
+    manager.negative_cache_ttl_seconds = 5.0
+
+    assert await manager.get_consent_artifact("a1") is None
+    now[0] += 4.0
+    assert await manager.get_consent_artifact("a1") is None
+    assert manager.fetches == 1
+
+    manager.store["a1"] = {"id": "a1"}
+    now[0] += 2.0
+    assert await manager.get_consent_artifact("a1") == {"id": "a1"}
+    assert manager.fetches == 2
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted():
+    manager = _PolicyManager()
+    await manager.get_policy_details("p1")
+    await manager.get_policy_details("p2")
+    await manager.get_policy_details("p1") # p2 is now the least recently used
+    await manager.get_policy_details("p3")
+
+    await manager.get_policy_details("p1")
+    await manager.get_policy_details("p2")
+    assert manager.fetched == ["p1", "p2", "p3", "p2"]
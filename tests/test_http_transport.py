@@ -0,0 +1,121 @@
+# /home/ubuntu/mtap_sdk/tests/test_http_transport.py
+import asyncio
+
+import httpx
+import pytest
+
+from mtap_sdk.core.config import ConnectionLimits, RetryConfig, TimeoutConfig
+from mtap_sdk.core.errors import NetworkError
+from mtap_sdk.transport.http import HttpTransport
+
+URL = "http://mtap.test/v1/memories"
+
+def _transport(handler, max_connections=1, **kwargs) -> HttpTransport:
+    transport = HttpTransport(limits=ConnectionLimits(max_connections=max_connections), **kwargs)
+    transport.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return transport
+
+class _Body(httpx.AsyncByteStream):
+    """An unread body, so the response stays open (holding its connection) until it is closed."""
+
+    async def __aiter__(self):
+        yield b"x" * 1024
+
+def _ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, stream=_Body())
+
+def _assert_idle(transport: HttpTransport) -> None:
+    assert transport.stats() == {"in_flight": 0, "open_streams": 0, "waiting": 0, "max_concurrency": 1}
+    assert not transport._gate.locked()
+
+async def _wait_until(predicate) -> None:
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+@pytest.mark.asyncio
+async def test_streamed_response_holds_its_slot_until_closed():
+    transport = _transport(_ok)
+    response = await transport.request("GET", URL, stream_response=True)
+    assert transport.stats()["open_streams"] == 1
+    assert transport._gate.locked()
+
+    assert len(await response.aread()) == 1024
+    await response.aclose()
+    await response.aclose() # closing twice releases the slot once
+    _assert_idle(transport)
+    await transport.close()
+
+@pytest.mark.asyncio
+async def test_already_read_streamed_response_does_not_hold_a_slot():
+    transport = _transport(lambda request: httpx.Response(200, content=b"x"))
+    response = await transport.request("GET", URL, stream_response=True)
+    assert response.content == b"x"
+    _assert_idle(transport)
+    await transport.close()
+
+@pytest.mark.asyncio
+async def test_discarded_retry_response_releases_its_slot():
+    statuses = iter([503, 200])
+    transport = _transport(
+        lambda request: httpx.Response(next(statuses), stream=_Body()),
+        retry_config=RetryConfig(attempts=2, backoff_factor=0.0),
+    )
+    response = await transport.request("GET", URL, stream_response=True)
+    assert response.status_code == 200
+    await response.aclose()
+    _assert_idle(transport)
+    await transport.close()
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    transport = _transport(_ok)
+    held = await transport.request("GET", URL, stream_response=True)
+    waiter = asyncio.ensure_future(transport.request("GET", URL))
+    await _wait_until(lambda: transport.stats()["waiting"] == 1)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert transport.stats()["waiting"] == 0
+
+    await held.aclose()
+    _assert_idle(transport)
+    assert (await transport.request("GET", URL)).status_code == 200
+    _assert_idle(transport)
+    await transport.close()
+
+@pytest.mark.asyncio
+async def test_waiting_for_a_slot_times_out_with_network_error():
+    transport = _transport(_ok, retry_config=RetryConfig(attempts=1))
+    held = await transport.request("GET", URL, stream_response=True)
+
+    with pytest.raises(NetworkError, match="free connection"):
+        await transport.request("GET", URL, timeout=TimeoutConfig(connect_timeout=0.01))
+    assert transport.stats()["waiting"] == 0
+
+    await held.aclose()
+    _assert_idle(transport)
+    await transport.close()
+
+@pytest.mark.asyncio
+async def test_preconnect_is_skipped_once_the_pool_has_been_used():
+    methods = []
+    def handler(request):
+        methods.append(request.method)
+        return httpx.Response(200)
+    transport = _transport(handler)
+    await transport.preconnect(URL)
+    await transport.preconnect(URL)
+    await transport.request("GET", URL)
+    assert methods == ["HEAD", "GET"]
+
+    fresh = _transport(handler)
+    methods.clear()
+    await fresh.request("GET", URL)
+    await fresh.preconnect(URL)
+    assert methods == ["GET"]
+    await transport.close()
+    await fresh.close()
@@ -0,0 +1,45 @@
+# /home/ubuntu/mtap_sdk/tests/test_multipart.py
+import pytest
+
+from mtap_sdk.transport.multipart import CHUNK_SIZE, MultipartEncoder
+
+async def _collect(encoder: MultipartEncoder) -> bytes:
+    return b"".join([chunk async for chunk in encoder])
+
+@pytest.mark.asyncio
+async def test_content_length_matches_body_for_in_memory_parts():
+    encoder = MultipartEncoder({
+        "metadata": (None, '{"k":"välue"}', "application/json"), # str content, non-ASCII
+        "context": (None, b"{}", "application/json"),
+        "data": ('na"me.bin', b"x" * (CHUNK_SIZE * 2 + 7), "application/octet-stream", {"Content-Encoding": "gzip"}),
+    })
+    body = await _collect(encoder)
+    assert encoder.content_length == len(body)
+    assert body.endswith(f"--{encoder.boundary}--\r\n".encode("ascii"))
+    assert b'filename="na%22me.bin"' in body
+    assert b"Content-Encoding: gzip\r\n" in body
+
+@pytest.mark.asyncio
+async def test_in_memory_body_can_be_iterated_again():
+    encoder = MultipartEncoder({"data": ("f", b"abc", "text/plain")})
+    assert await _collect(encoder) == await _collect(encoder)
+
+@pytest.mark.asyncio
+async def test_async_generator_part_has_no_content_length_and_streams_once():
+    async def chunks():
+        yield b"abc"
+        yield b"def"
+
+    encoder = MultipartEncoder({
+        "metadata": (None, b"{}", "application/json"),
+        "data": ("f", chunks(), "application/octet-stream"),
+    })
+    assert encoder.content_length is None
+
+    first = await _collect(encoder)
+    assert b"\r\n\r\nabcdef\r\n" in first
+    assert first.endswith(f"--{encoder.boundary}--\r\n".encode("ascii"))
+
+    # The generator is exhausted after the first pass, so a second pass has an empty data part.
+    second = await _collect(encoder)
+    assert b"abcdef" not in second
@@ -0,0 +1,51 @@
+# /home/ubuntu/mtap_sdk/tests/test_serialization.py
+import httpx
+import pytest
+
+from mtap_sdk.core import serialization
+from mtap_sdk.transport.http import JSON_CONTENT_TYPE, HttpTransport
+
+PAYLOADS = [
+    {1: "x"},
+    {"user": {2: [1, 2.5, None, True]}, "name": "välue"},
+    {"big": 2 ** 70},
+]
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+def _stdlib_dumps_bytes(obj) -> bytes:
+    orjson, serialization.orjson = serialization.orjson, None
+    try:
+        return serialization.dumps_bytes(obj)
+    finally:
+        serialization.orjson = orjson
+
+def test_non_str_keys_round_trip_as_strings(json_backend):
+    assert serialization.loads(serialization.dumps_bytes({1: "x"})) == {"1": "x"}
+    assert serialization.loads(serialization.dumps({1: "x"})) == {"1": "x"}
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_output_does_not_depend_on_the_backend(json_backend, payload):
+    expected = _stdlib_dumps_bytes(payload)
+    assert serialization.dumps_bytes(payload) == expected
+    assert serialization.dumps(payload) == expected.decode("utf-8")
+
+@pytest.mark.asyncio
+async def test_transport_sends_json_data_with_the_shared_encoder(json_backend):
+    sent = []
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(200)
+    transport = HttpTransport()
+    transport.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    await transport.request("POST", "http://mtap.test/v1/memories", json_data={1: "x"})
+    await transport.close()
+
+    assert serialization.loads(sent[0].content) == {"1": "x"}
+    assert sent[0].headers["Content-Type"] == JSON_CONTENT_TYPE
@@ -15,6 +15,7 @@ class BaseTransport(ABC):
         headers: Optional[Dict[str, str]] = None,
         data: Optional[bytes] = None,
         json_data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
         stream_data: Optional[AsyncGenerator[bytes, None]] = None,
         timeout: Optional[TimeoutConfig] = None,
         stream_response: bool = False
@@ -27,13 +28,25 @@ class BaseTransport(ABC):
             headers: Request headers.
             data: Raw byte payload.
             json_data: JSON payload (will be serialized).
+            files: Multipart/form-data fields in the httpx `files` layout,
+                `{field_name: (filename, content, content_type)}`, encoded by the transport.
             stream_data: An async generator yielding bytes for streaming request body.
             timeout: Timeout configuration for this specific request.
             stream_response: Whether to stream the response body.
 
+        At most one of `data`, `json_data`, `files` and `stream_data` may be given.
+
         Returns:
             A transport-specific response object.
-        ""
+        """
+        pass
+
+    async def preconnect(self, url: str) -> None:
+        """Opens a pooled connection to `url` ahead of the first request.
+
+        Best effort: implementations must not raise, and should do nothing once the pool has been
+        used (by a request or an earlier preconnect). The default implementation does nothing.
+        """
         pass
 
     @abstractmethod
@@ -1,35 +1,183 @@
 # /home/ubuntu/mtap_sdk/transport/http.py
 import httpx
 import asyncio # For asyncio.sleep in retry logic
+import functools
+import importlib.util
+import logging
 import random # For jitter in retry logic
-from typing import Any, Dict, Optional, AsyncGenerator
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Dict, Optional
 
 from .base import BaseTransport
-from mtap_sdk.core.config import TimeoutConfig, RetryConfig
-from mtap_sdk.core.errors import NetworkError, MtapApiError, ConfigurationError
+from mtap_sdk.core import serialization
+from mtap_sdk.core.config import TimeoutConfig, RetryConfig, ConnectionLimits
+from mtap_sdk.core.errors import NetworkError, MtapApiError, ConfigurationError, InvalidRequestError
+
+try:
+    import aiohttp
+except ImportError: # aiohttp is an optional backend, installed via the "aiohttp" extra
+    aiohttp = None
+
+AIOHTTP_AVAILABLE = aiohttp is not None
+
+# h2 is required by httpx for HTTP/2 and installed with httpx[http2]; it is only missing if httpx
+# was installed without the extra, in which case HTTP/1.1 is used.
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+logger = logging.getLogger(__name__)
+
+JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+
+def _backoff_delays(retry_config: RetryConfig) -> tuple:
+    """Precomputes the un-jittered delay before each retry (index = attempt - 1), capped at max_retry_delay."""
+    return tuple(
+        min(retry_config.backoff_factor * (1 << i), retry_config.max_retry_delay)
+        for i in range(max(retry_config.attempts - 1, 0))
+    )
+
+def _check_single_payload(data: Any, json_data: Any, files: Any, stream_data: Any) -> None:
+    """Raises InvalidRequestError if more than one of the mutually exclusive body arguments is given."""
+    if (data is not None) + (json_data is not None) + (files is not None) + (stream_data is not None) > 1:
+        raise InvalidRequestError("Only one of data, json_data, files or stream_data may be given.")
+
+def _with_json_content_type(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Returns `headers` with a JSON Content-Type added, unless the caller already set one."""
+    if headers and ("Content-Type" in headers or "content-type" in headers):
+        return headers
+    return {**(headers or {}), "Content-Type": JSON_CONTENT_TYPE}
+
+def _is_replayable(body: Any) -> bool:
+    """Whether a request body can be sent again on retry.
+
+    Async generators (and multipart bodies with a part streamed from one) are consumed by the
+    first attempt, so a retry would send a truncated body.
+    """
+    if body is None or isinstance(body, (bytes, bytearray, memoryview, str)):
+        return True
+    return getattr(body, "content_length", None) is not None # MultipartEncoder with in-memory parts
+
+def _jittered(base_delay: float, cap: float, _random=random.random) -> float:
+    """Adds +/- 10% jitter to a precomputed backoff delay, without exceeding `cap`."""
+    return min(base_delay + base_delay * 0.2 * (_random() - 0.5), cap)
+
+class _SlotReleasingStream(httpx.AsyncByteStream):
+    """Wraps a streamed response body so `on_close` runs once, when the response is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close: Optional[Callable[[], None]] = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                on_close, self._on_close = self._on_close, None
+                on_close()
+
+async def _acquire_slot(gate: asyncio.Semaphore, timeout: float) -> None:
+    """Acquires `gate`, raising asyncio.TimeoutError after `timeout` seconds.
+
+    The acquire runs as its own task so that a slot granted just as the wait times out (or as the
+    caller is cancelled) is given back rather than leaked.
+    """
+    if not gate.locked():
+        await gate.acquire() # Free slot: returns without suspending
+        return
+    acquire = asyncio.ensure_future(gate.acquire())
+    try:
+        await asyncio.wait_for(asyncio.shield(acquire), timeout)
+    except BaseException:
+        if acquire.done() and not acquire.cancelled():
+            gate.release()
+        else:
+            acquire.cancel()
+        raise
+
+@functools.lru_cache(maxsize=64)
+def _build_timeout(connect: float, read: float, write: float) -> httpx.Timeout:
+    """Returns an httpx.Timeout for the given values; the objects are immutable, so they are shared."""
+    return httpx.Timeout(connect, read=read, write=write)
 
 class HttpTransport(BaseTransport):
     """HTTP/S transport implementation using HTTPX."""
 
-    def __init__(self, retry_config: Optional[RetryConfig] = None, default_timeout: Optional[TimeoutConfig] = None):
+    def __init__(
+        self,
+        retry_config: Optional[RetryConfig] = None,
+        default_timeout: Optional[TimeoutConfig] = None,
+        limits: Optional[ConnectionLimits] = None,
+        http2: bool = True,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        default_headers: Optional[Dict[str, str]] = None
+    ):
         self._retry_config = retry_config if retry_config else RetryConfig()
         self._default_timeout = default_timeout if default_timeout else TimeoutConfig()
-        
-        if not isinstance(self._default_timeout, TimeoutConfig):
-            raise ConfigurationError("Invalid default_timeout provided to HttpTransport.")
-        if not isinstance(self._retry_config, RetryConfig):
-            raise ConfigurationError("Invalid retry_config provided to HttpTransport.")
+        self._limits = limits if limits else ConnectionLimits()
+        if max_connections is not None or max_keepalive_connections is not None:
+            self._limits = ConnectionLimits(
+                max_connections=max_connections if max_connections is not None else self._limits.max_connections,
+                max_keepalive_connections=(
+                    max_keepalive_connections if max_keepalive_connections is not None
+                    else self._limits.max_keepalive_connections
+                ),
+                keepalive_expiry=self._limits.keepalive_expiry
+            )
+        # HTTP/2 lets concurrent requests share one connection as multiplexed streams.
+        # httpx falls back to HTTP/1.1 if the server does not negotiate h2 via ALPN.
+        self.http2 = http2 and H2_AVAILABLE
+
+        # Checked on every response, so it is converted once for O(1) membership tests.
+        self._forcelist = frozenset(self._retry_config.status_forcelist)
+        self._base_delays = _backoff_delays(self._retry_config)
 
         # Note: httpx.Timeout can take connect, read, write, pool timeouts.
         # We are using connect and read from our TimeoutConfig.
         # Write timeout can be set per-request if needed, or added to global client timeout.
+        # A single long-lived client is kept for the lifetime of the transport so that
+        # pooled connections (and their TCP/TLS handshakes) are reused across requests.
+        # The pool transport is built explicitly with retries=0: retrying is done by request() below.
+        self._default_httpx_timeout = _build_timeout(
+            self._default_timeout.connect_timeout,
+            self._default_timeout.read_timeout,
+            self._default_timeout.write_timeout
+        )
+        # Headers sent with every request are set once on the client instead of being merged per call.
         self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(
-                self._default_timeout.connect_timeout, 
-                read=self._default_timeout.read_timeout,
-                write=self._default_timeout.write_timeout
-            )
+            headers=default_headers,
+            timeout=self._default_httpx_timeout,
+            transport=httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=self._limits.max_connections,
+                    max_keepalive_connections=self._limits.max_keepalive_connections,
+                    keepalive_expiry=self._limits.keepalive_expiry
+                ),
+                http2=self.http2,
+                retries=0
+            ),
+            http2=self.http2
         )
+        # Requests beyond the pool size wait here, in FIFO order, instead of queueing inside httpx's pool.
+        # Streamed responses keep their connection (and their slot) until they are read or closed.
+        self._gate = asyncio.Semaphore(self._limits.max_connections)
+        self._inflight = 0
+        self._waiting = 0
+        self._open_streams = 0
+        self._pool_used = False # Set by the first request or preconnect; later preconnects are skipped
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of requests currently being sent, streamed responses not yet closed,
+        and requests waiting for a free slot."""
+        return {
+            "in_flight": self._inflight,
+            "open_streams": self._open_streams,
+            "waiting": self._waiting,
+            "max_concurrency": self._limits.max_connections,
+        }
 
     async def request(
         self,
@@ -43,111 +191,268 @@ class HttpTransport(BaseTransport):
         timeout: Optional[TimeoutConfig] = None,
         stream_response: bool = False
     ) -> httpx.Response:
-        current_timeout_config = timeout if timeout else self._default_timeout
-        httpx_timeout = httpx.Timeout(
-            current_timeout_config.connect_timeout, 
-            read=current_timeout_config.read_timeout,
-            write=current_timeout_config.write_timeout
-        )
+        if timeout is None or timeout is self._default_timeout:
+            timeout = self._default_timeout
+            httpx_timeout = self._default_httpx_timeout
+        else:
+            httpx_timeout = _build_timeout(timeout.connect_timeout, timeout.read_timeout, timeout.write_timeout)
 
-        # Determine content: stream_data > data > json_data. `files` is handled separately by httpx.
-        content_payload = None
-        if stream_data:
-            content_payload = stream_data
-        elif data:
-            content_payload = data
-        # `json_data` is passed directly to httpx.request if `data` and `stream_data` are None.
-        # `files` is also passed directly to httpx.request.
-
-        attempts_left = self._retry_config.attempts
-        current_attempt = 0
+        # Pick the single httpx body argument in one pass. `files` is encoded by httpx;
+        # `json_data` is serialized here.
+        _check_single_payload(data, json_data, files, stream_data)
+        if files is not None:
+            body_arg, body = "files", files
+        elif stream_data is not None:
+            body_arg, body = "content", stream_data
+        elif data is not None:
+            body_arg, body = "content", data
+        elif json_data is not None:
+            body_arg, body = "content", serialization.dumps_bytes(json_data)
+            headers = _with_json_content_type(headers)
+        else:
+            body_arg, body = None, None
+        request_args: Dict[str, Any] = {"headers": headers, "timeout": httpx_timeout}
+        if body_arg is not None:
+            request_args[body_arg] = body
+        # The request is built once and re-sent as-is on retry.
+        request = self.client.build_request(method, url, **request_args)
+
+        max_attempts = max(self._retry_config.attempts, 1) if _is_replayable(stream_data) else 1
+        # Looked up once per request rather than once per attempt.
+        forcelist = self._forcelist
+        gate = self._gate
+        # Waiting for a free slot counts against the connect timeout, as waiting for a pooled connection would.
+        gate_timeout = timeout.connect_timeout
+        send = self.client.send
+        sleep = asyncio.sleep
         last_exception: Optional[Exception] = None
+        self._pool_used = True
 
-        while current_attempt < self._retry_config.attempts:
-            current_attempt += 1
+        for current_attempt in range(1, max_attempts + 1):
             try:
-                request_args = {
-                    "method": method,
-                    "url": url,
-                    "headers": headers,
-                    "timeout": httpx_timeout
-                }
-                if files:
-                    request_args["files"] = files
-                elif content_payload:
-                    request_args["content"] = content_payload
-                elif json_data:
-                    request_args["json"] = json_data
-                
-                if stream_response:
-                    # For streaming responses, build request and send with stream=True
-                    req = self.client.build_request(**request_args) # type: ignore
-                    response = await self.client.send(req, stream=True)
-                else:
-                    response = await self.client.request(**request_args) # type: ignore
-
-                # If successful (even if it's an HTTP error status that we don't retry on), return response.
-                # Retrying for specific status codes is handled here if configured.
-                if response.status_code in self._retry_config.status_forcelist and current_attempt < self._retry_config.attempts:
-                    # This will be caught by HTTPStatusError below if we raise it, or we can handle retry directly.
-                    # To trigger retry, we can simulate an error or just continue the loop after a delay.
-                    try:
-                        response.raise_for_status() # Raise for 4xx/5xx if not in forcelist
-                    except httpx.HTTPStatusError as e_status:
-                        if e_status.response.status_code in self._retry_config.status_forcelist:
-                            last_exception = e_status
-                            # Proceed to delay and retry
-                        else:
-                            raise # Not a retryable status error, re-raise immediately
-                    else: # No HTTPStatusError raised, but status is in forcelist (e.g. 200 in forcelist - unlikely)
-                        return response # If it was successful and in forcelist, still return
+                self._waiting += 1
+                try:
+                    await _acquire_slot(gate, gate_timeout)
+                finally:
+                    self._waiting -= 1
+                self._inflight += 1
+                slot_held = False
+                try:
+                    response = await send(request, stream=stream_response)
+                    if stream_response and not response.is_closed:
+                        # The pooled connection stays checked out until the response is closed,
+                        # so the slot is handed over to the response and released from aclose().
+                        response.stream = _SlotReleasingStream(response.stream, self._release_stream_slot)
+                        self._open_streams += 1
+                        slot_held = True
+                finally:
+                    self._inflight -= 1
+                    if not slot_held:
+                        gate.release()
+
+                # Statuses in the forcelist are retried while attempts remain; any other response
+                # (or the last one) is returned, and _make_request handles non-expected status codes.
+                status = response.status_code
+                if status in forcelist and current_attempt < max_attempts:
+                    await response.aclose() # Release the connection before retrying (matters for streamed responses)
+                    last_exception = MtapApiError(message=f"HTTP error {status} for {url}", status_code=status)
                 else:
-                    # If not in forcelist or no attempts left, return the response.
-                    # The calling layer (_make_request) will handle non-expected status codes.
                     return response
 
+            except asyncio.TimeoutError:
+                last_exception = NetworkError(
+                    f"Timed out waiting for a free connection to {url} on attempt {current_attempt} "
+                    f"({self._limits.max_connections} already in use)"
+                )
             except httpx.TimeoutException as e:
                 last_exception = NetworkError(f"Request timed out to {url} on attempt {current_attempt}: {e}")
             except httpx.NetworkError as e: # Catches ConnectError, ReadError etc.
                 last_exception = NetworkError(f"Network error connecting to {url} on attempt {current_attempt}: {e}")
-            except httpx.HTTPStatusError as e: # This is raised by response.raise_for_status()
-                last_exception = e # Keep it as HTTPStatusError for now, to check status_forcelist
-                if e.response.status_code not in self._retry_config.status_forcelist:
-                    # If it's an HTTP error not in the forcelist, we shouldn't retry at transport layer.
-                    # Let the client layer handle it as a specific MtapApiError.
-                    # However, the current logic means we return the response, and client layer handles it.
-                    # This part of the logic needs to be clean: either transport retries or client does.
-                    # For now, if raise_for_status() is called and it's not in forcelist, it should be re-raised.
-                    # The current structure returns the response, and _make_request checks expected_status.
-                    # Let's stick to: transport retries on network errors and specific status_forcelist codes.
-                    raise # Re-raise if not in forcelist, _make_request will handle it.
             except Exception as e:
                 last_exception = NetworkError(f"Unexpected error during HTTP request to {url} on attempt {current_attempt}: {e}")
             
             # If we are here, an error occurred and we might retry
-            if current_attempt < self._retry_config.attempts:
-                delay = (self._retry_config.backoff_factor * (2 ** (current_attempt - 1)))
-                jitter = delay * 0.1 * random.uniform(-1, 1) # Add +/- 10% jitter
-                actual_delay = min(delay + jitter, self._retry_config.max_retry_delay)
-                actual_delay = max(0, actual_delay) # Ensure delay is not negative
-                print(f"Request to {url} failed (attempt {current_attempt}/{self._retry_config.attempts}), retrying in {actual_delay:.2f}s. Error: {last_exception}")
-                await asyncio.sleep(actual_delay)
-            else: # Max attempts reached
-                break
-        
-        if last_exception:
-            # If HTTPStatusError was the last exception and it was in forcelist, we might re-raise it as MtapApiError or NetworkError
-            if isinstance(last_exception, httpx.HTTPStatusError):
-                 # Let _make_request handle this by returning the problematic response if it was received
-                 # This path is tricky. If all retries for a status_forcelist item fail, we should raise.
-                 # The current code returns the response if it's received. If it's an HTTPStatusError from raise_for_status, it's re-raised if not in forcelist.
-                 # If it *is* in forcelist and retries are exhausted, we fall through and raise the last_exception.
-                 raise MtapApiError(message=f"HTTP error after retries: {last_exception.response.status_code} for {url}", status_code=last_exception.response.status_code)
-            raise last_exception # Should be NetworkError or a wrapped unexpected error
-        else:
-            # Should not be reached if loop completes without returning a response or raising an exception
-            raise NetworkError(f"Request failed after {self._retry_config.attempts} attempts to {url} (unexpected state)")
+            if current_attempt < max_attempts:
+                actual_delay = _jittered(self._base_delays[current_attempt - 1], self._retry_config.max_retry_delay)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Request to %s failed (attempt %d/%d), retrying in %.2fs. Error: %s",
+                        url, current_attempt, max_attempts, actual_delay, last_exception
+                    )
+                await sleep(actual_delay)
+
+        # Every attempt failed without a response to return.
+        raise last_exception
+
+    def _release_stream_slot(self) -> None:
+        self._open_streams -= 1
+        self._gate.release()
+
+    async def preconnect(self, url: str) -> None:
+        if self._pool_used: # e.g. a shared transport that another client has already warmed up
+            return
+        self._pool_used = True
+        # httpx has no public API to open a bare connection; a HEAD request leaves one in the pool.
+        try:
+            await self.client.head(url)
+        except httpx.HTTPError:
+            pass
 
     async def close(self) -> None:
         await self.client.aclose()
 
+
+
+class AiohttpResponse:
+    """Wraps an aiohttp.ClientResponse with the subset of the httpx.Response API used by MtapClient."""
+
+    def __init__(self, response: "aiohttp.ClientResponse", body: Optional[bytes] = None):
+        self._response = response
+        self._body = body
+        self.status_code: int = response.status
+        self.headers = response.headers # Case-insensitive, like httpx.Headers
+
+    async def aread(self) -> bytes:
+        if self._body is None:
+            self._body = await self._response.read()
+        return self._body
+
+    async def aiter_bytes(self, chunk_size: Optional[int] = None) -> AsyncGenerator[bytes, None]:
+        async for chunk in self._response.content.iter_chunked(chunk_size or 65536):
+            yield chunk
+
+    async def aclose(self) -> None:
+        self._response.release()
+
+@functools.lru_cache(maxsize=64)
+def _build_client_timeout(connect: float, read: float) -> "aiohttp.ClientTimeout":
+    """aiohttp counterpart of `_build_timeout`."""
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+
+class AiohttpTransport(BaseTransport):
+    """HTTP/S transport implementation using aiohttp.
+
+    A single ClientSession (and therefore a single connection pool) is created lazily on
+    first use, inside the running event loop, and reused for every request.
+    """
+
+    def __init__(
+        self,
+        retry_config: Optional[RetryConfig] = None,
+        default_timeout: Optional[TimeoutConfig] = None,
+        limits: Optional[ConnectionLimits] = None,
+        default_headers: Optional[Dict[str, str]] = None
+    ):
+        if not AIOHTTP_AVAILABLE:
+            raise ConfigurationError("AiohttpTransport requires aiohttp. Install it with `pip install mtap_sdk[aiohttp]`.")
+        self._retry_config = retry_config if retry_config else RetryConfig()
+        self._default_timeout = default_timeout if default_timeout else TimeoutConfig()
+        self._limits = limits if limits else ConnectionLimits()
+        self._forcelist = frozenset(self._retry_config.status_forcelist)
+        self._base_delays = _backoff_delays(self._retry_config)
+        self._default_client_timeout = _build_client_timeout(
+            self._default_timeout.connect_timeout, self._default_timeout.read_timeout
+        )
+        self._default_headers = default_headers
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._pool_used = False
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            # The SDK talks to a single host, so `limit` alone bounds the pool (limit_per_host=0: no
+            # separate per-host cap). aiohttp cannot cap idle connections, so
+            # max_keepalive_connections does not apply to this transport.
+            connector = aiohttp.TCPConnector(
+                limit=self._limits.max_connections,
+                limit_per_host=0,
+                keepalive_timeout=self._limits.keepalive_expiry
+            )
+            self._session = aiohttp.ClientSession(connector=connector, headers=self._default_headers)
+        return self._session
+
+    @staticmethod
+    def _build_form_data(files: Dict[str, Any]) -> "aiohttp.FormData":
+        # `files` uses the httpx layout: {field_name: (filename, content, content_type)}
+        form = aiohttp.FormData()
+        for field_name, (filename, content, content_type) in files.items():
+            form.add_field(field_name, content, filename=filename, content_type=content_type)
+        return form
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[bytes] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        stream_data: Optional[AsyncGenerator[bytes, None]] = None,
+        timeout: Optional[TimeoutConfig] = None,
+        stream_response: bool = False
+    ) -> AiohttpResponse:
+        if timeout is None or timeout is self._default_timeout:
+            client_timeout = self._default_client_timeout
+        else:
+            client_timeout = _build_client_timeout(timeout.connect_timeout, timeout.read_timeout)
+        session = self._get_session()
+
+        _check_single_payload(data, json_data, files, stream_data)
+        request_args: Dict[str, Any] = {"headers": headers, "timeout": client_timeout}
+        if stream_data is not None:
+            request_args["data"] = stream_data
+        elif data is not None:
+            request_args["data"] = data
+        elif json_data is not None:
+            request_args["data"] = serialization.dumps_bytes(json_data)
+            request_args["headers"] = _with_json_content_type(headers)
+
+        max_attempts = max(self._retry_config.attempts, 1) if _is_replayable(stream_data) else 1
+        forcelist = self._forcelist
+        last_exception: Optional[Exception] = None
+        self._pool_used = True
+        for current_attempt in range(1, max_attempts + 1):
+            if files is not None:
+                # FormData can only be serialized once, so it is rebuilt for every attempt.
+                request_args["data"] = self._build_form_data(files)
+            try:
+                response = await session.request(method, url, **request_args)
+                if response.status in forcelist and current_attempt < max_attempts:
+                    response.release()
+                    last_exception = MtapApiError(message=f"HTTP error {response.status} for {url}", status_code=response.status)
+                elif stream_response:
+                    return AiohttpResponse(response)
+                else:
+                    # Buffer the body so the connection goes back to the pool right away.
+                    body = await response.read()
+                    response.release()
+                    return AiohttpResponse(response, body)
+            except asyncio.TimeoutError as e:
+                last_exception = NetworkError(f"Request timed out to {url} on attempt {current_attempt}: {e}")
+            except aiohttp.ClientError as e:
+                last_exception = NetworkError(f"Network error connecting to {url} on attempt {current_attempt}: {e}")
+
+            if current_attempt < max_attempts:
+                actual_delay = _jittered(self._base_delays[current_attempt - 1], self._retry_config.max_retry_delay)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Request to %s failed (attempt %d/%d), retrying in %.2fs. Error: %s",
+                        url, current_attempt, max_attempts, actual_delay, last_exception
+                    )
+                await asyncio.sleep(actual_delay)
+
+        raise last_exception
+
+    async def preconnect(self, url: str) -> None:
+        if self._pool_used:
+            return
+        self._pool_used = True
+        try:
+            response = await self._get_session().head(url)
+            response.release()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
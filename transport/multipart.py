@@ -0,0 +1,69 @@
+# /home/ubuntu/mtap_sdk/transport/multipart.py
+import secrets
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+# Size of the chunks in which in-memory part contents are yielded.
+CHUNK_SIZE = 64 * 1024
+
+class MultipartEncoder:
+    """Streams a multipart/form-data body without building it in memory.
+
+    `fields` uses the same layout as httpx's `files` argument:
+    `{name: (filename, content, content_type)}` or `{name: (filename, content, content_type, headers)}`,
+    where `content` is `str`, `bytes`, or an async iterable of `bytes`.
+
+    The encoder is an async iterable of body chunks. When every part is in memory it can be iterated
+    more than once (so transports can retry the request) and `content_length` is known up front;
+    parts backed by an async iterable are streamed through as they arrive and can only be sent once.
+    """
+
+    def __init__(self, fields: Dict[str, Tuple[Any, ...]], boundary: Optional[str] = None):
+        self.boundary = boundary or secrets.token_hex(16)
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self._parts: List[Tuple[bytes, Union[bytes, AsyncIterator[bytes]]]] = []
+        for name, field_value in fields.items():
+            filename, content, content_type = field_value[:3]
+            extra_headers = field_value[3] if len(field_value) > 3 else None
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            self._parts.append((self._part_header(name, filename, content_type, extra_headers), content))
+        self._closing_boundary = f"--{self.boundary}--\r\n".encode("ascii")
+
+    def _part_header(
+        self, name: str, filename: Optional[str], content_type: Optional[str], extra_headers: Optional[Dict[str, str]]
+    ) -> bytes:
+        disposition = f'form-data; name="{_quote(name)}"'
+        if filename is not None:
+            disposition += f'; filename="{_quote(filename)}"'
+        lines = [f"--{self.boundary}", f"Content-Disposition: {disposition}"]
+        if content_type:
+            lines.append(f"Content-Type: {content_type}")
+        for header_name, header_value in (extra_headers or {}).items():
+            lines.append(f"{header_name}: {header_value}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8")
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """Total body size in bytes, or None if a part is streamed from an async iterable."""
+        total = len(self._closing_boundary)
+        for header, content in self._parts:
+            if not isinstance(content, (bytes, bytearray, memoryview)):
+                return None
+            total += len(header) + len(content) + 2 # +2 for the CRLF that ends each part
+        return total
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for header, content in self._parts:
+            yield header
+            if isinstance(content, (bytes, bytearray, memoryview)):
+                for offset in range(0, len(content), CHUNK_SIZE):
+                    yield bytes(content[offset:offset + CHUNK_SIZE])
+            else:
+                async for chunk in content:
+                    yield chunk
+            yield b"\r\n"
+        yield self._closing_boundary
+
+def _quote(value: str) -> str:
+    # Same escaping httpx applies to form-data parameters.
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")